@@ -104,3 +104,118 @@ def test_chess_board_rendering():
     # Check for board elements
     assert "a" in board_str and "h" in board_str  # Column labels
     assert "1" in board_str and "8" in board_str  # Row labels
+
+
+class BrokenPool:
+    """Stand-in process pool whose workers have all died."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.shut_down = False
+
+    def submit(self, *args, **kwargs):
+        from concurrent.futures.process import BrokenProcessPool
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+@pytest.mark.skipif(not CHESS_AVAILABLE, reason="python-chess not installed")
+@pytest.mark.asyncio
+async def test_chess_wopr_move_falls_back_when_pool_breaks(monkeypatch):
+    """A broken worker pool still yields a legal move and is discarded."""
+    import wopr.games.board.chess as chess_module
+
+    pools = []
+
+    def make_pool(**kwargs):
+        pools.append(BrokenPool(**kwargs))
+        return pools[-1]
+
+    monkeypatch.setattr(chess_module, "ProcessPoolExecutor", make_pool)
+
+    game = ChessGame(lambda x: None, lambda: "", difficulty=1)
+    game._board = chess.Board()
+    game._board.push_uci("e2e4")
+
+    move = await game._get_wopr_move()
+
+    assert move in game._board.legal_moves
+    assert pools[0].kwargs["mp_context"].get_start_method() == "spawn"
+    assert pools[0].shut_down
+    assert game._pool is None
+
+    # The next move starts a fresh pool rather than reusing the dead one
+    game._board.push(move)
+    game._board.push_uci("d2d4")
+    assert await game._get_wopr_move() in game._board.legal_moves
+    assert len(pools) == 2
+
+
+@pytest.mark.skipif(not CHESS_AVAILABLE, reason="python-chess not installed")
+@pytest.mark.asyncio
+async def test_chess_engine_missing(monkeypatch):
+    """Without Stockfish on PATH the engine is skipped for the whole game."""
+    import wopr.games.board.chess as chess_module
+
+    lookups = []
+
+    def which(name):
+        lookups.append(name)
+        return None
+
+    monkeypatch.setattr(chess_module.shutil, "which", which)
+
+    game = ChessGame(lambda x: None, lambda: "")
+    game._board = chess.Board()
+
+    assert await game._get_engine_move() is None
+    assert await game._get_engine_move() is None
+    assert lookups == ["stockfish"]
+    assert game._engine_unavailable
+
+
+class FailingEngine:
+    """Stand-in UCI engine that errors on every search."""
+
+    def __init__(self):
+        self.options = {}
+        self.quit_called = False
+
+    async def play(self, board, limit):
+        raise chess.engine.EngineError("engine crashed")
+
+    async def quit(self):
+        self.quit_called = True
+
+
+@pytest.mark.skipif(not CHESS_AVAILABLE, reason="python-chess not installed")
+@pytest.mark.asyncio
+async def test_chess_engine_error_falls_back_to_minimax(monkeypatch):
+    """An engine error closes the engine and WOPR still moves by minimax."""
+    import wopr.games.board.chess as chess_module
+
+    engine = FailingEngine()
+
+    async def popen_uci(path):
+        return None, engine
+
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(chess_module.shutil, "which", lambda name: "/usr/bin/stockfish")
+    monkeypatch.setattr(chess.engine, "popen_uci", popen_uci)
+    monkeypatch.setattr(chess_module.asyncio, "sleep", no_sleep)
+    monkeypatch.setattr(chess_module, "ProcessPoolExecutor", BrokenPool)
+
+    io = MockIO(["e2e4", "QUIT"])
+    game = ChessGame(io.output_callback, io.input_callback, difficulty=1)
+    result = await game.play()
+
+    from wopr.games.base import GameResult
+    assert result["result"] == GameResult.QUIT
+    assert "WOPR PLAYS" in io.get_output()
+    assert engine.quit_called
+    assert game._engine is None
+    assert game._engine_unavailable
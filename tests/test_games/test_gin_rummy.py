@@ -0,0 +1,142 @@
+"""Tests for Gin Rummy game logic."""
+
+import random
+
+from wopr.games.cards.gin_rummy import GinRummy
+
+
+def hand(*cards: str) -> list[tuple[str, str]]:
+    """Build a hand from strings like "A♠" or "10♥"."""
+    return [(card[:-1], card[-1]) for card in cards]
+
+
+def test_four_card_set():
+    """Test all four cards of a rank form one set."""
+    game = GinRummy(lambda x: None, lambda: "")
+
+    melds, deadwood = game._find_melds(hand("7♠", "7♥", "7♦", "7♣", "K♠"))
+
+    assert [sorted(meld) for meld in melds] == [sorted(hand("7♠", "7♥", "7♦", "7♣"))]
+    assert deadwood == hand("K♠")
+
+
+def test_five_card_run():
+    """Test five consecutive cards of a suit form one run."""
+    game = GinRummy(lambda x: None, lambda: "")
+
+    melds, deadwood = game._find_melds(hand("3♥", "4♥", "5♥", "6♥", "7♥", "9♥"))
+
+    assert [sorted(meld) for meld in melds] == [sorted(hand("3♥", "4♥", "5♥", "6♥", "7♥"))]
+    assert deadwood == hand("9♥")
+
+
+def test_ace_low_run():
+    """Test A-2-3 is a run, aces being low."""
+    game = GinRummy(lambda x: None, lambda: "")
+
+    melds, deadwood = game._find_melds(hand("A♣", "2♣", "3♣"))
+
+    assert len(melds) == 1
+    assert deadwood == []
+
+
+def test_runs_do_not_wrap():
+    """Test Q-K-A is not a run."""
+    game = GinRummy(lambda x: None, lambda: "")
+
+    melds, deadwood = game._find_melds(hand("Q♦", "K♦", "A♦"))
+
+    assert melds == []
+    assert deadwood == hand("Q♦", "K♦", "A♦")
+
+
+def test_sets_take_shared_cards():
+    """Test a card that fits a set and a run goes to the set."""
+    game = GinRummy(lambda x: None, lambda: "")
+
+    melds, deadwood = game._find_melds(hand("5♠", "5♥", "5♦", "6♠", "7♠"))
+
+    assert [sorted(meld) for meld in melds] == [sorted(hand("5♠", "5♥", "5♦"))]
+    assert deadwood == hand("6♠", "7♠")
+
+
+def test_deadwood_value():
+    """Test deadwood counts aces 1, faces 10 and skips melded cards."""
+    game = GinRummy(lambda x: None, lambda: "")
+
+    assert game._deadwood_value(hand("K♠", "Q♥", "J♦", "10♣", "A♠", "2♥")) == 43
+    assert game._deadwood_value(hand("3♥", "4♥", "5♥", "K♠", "K♥", "K♦")) == 0
+    assert game._deadwood_value(hand("3♥", "4♥", "5♥", "8♠", "A♦")) == 9
+    assert game._deadwood_value([]) == 0
+
+
+def wopr_game(wopr_hand, discard, draw):
+    """Set up a WOPR turn with a known hand, discard pile top and next draw."""
+    game = GinRummy(lambda x: None, lambda: "")
+    game._wopr_hand = hand(*wopr_hand)
+    game._discard_pile = hand(discard)
+    game._deck = hand(draw)
+    return game
+
+
+def test_wopr_takes_and_keeps_meld_card():
+    """Test WOPR takes a discard that completes a meld and never throws it back."""
+    game = wopr_game(
+        ["5♠", "6♠", "K♥", "Q♦", "J♣", "9♥", "2♦", "3♣", "8♦", "10♥"], "7♠", "4♥"
+    )
+
+    game._wopr_turn()
+
+    assert ("7", "♠") in game._wopr_hand
+    assert game._deck == hand("4♥")  # took the discard instead of drawing
+    thrown = game._discard_pile[-1]
+    assert thrown != ("7", "♠")
+    assert game._card_points(thrown) == 10
+
+
+def test_wopr_discard_ties_go_to_higher_card():
+    """Test equal deadwood after discarding is broken by the higher card."""
+    game = wopr_game(
+        ["A♣", "2♣", "3♣", "4♣", "K♥", "K♦", "K♠", "5♦", "6♦", "7♦"], "9♥", "8♥"
+    )
+
+    game._wopr_turn()
+
+    # A♣, 4♣ and the drawn 8♥ all leave no deadwood; 8♥ scores highest
+    assert game._discard_pile[-1] == ("8", "♥")
+
+    game = wopr_game(
+        ["A♣", "2♣", "3♣", "4♣", "K♥", "K♦", "K♠", "5♦", "6♦", "7♦"], "9♥", "K♣"
+    )
+
+    game._wopr_turn()
+
+    # With four kings, any king can go and still beats A♣ and 4♣
+    assert game._discard_pile[-1][0] == "K"
+    assert game._deadwood_value(game._wopr_hand) == 0
+
+
+def test_wopr_gins_on_post_discard_deadwood(monkeypatch):
+    """Test WOPR declares gin when its hand is all melds after discarding."""
+    monkeypatch.setattr(random, "random", lambda: 0.99)  # never a chance knock
+    game = wopr_game(
+        ["A♣", "2♣", "3♣", "4♣", "K♥", "K♦", "K♠", "5♦", "6♦", "7♦"], "9♥", "Q♠"
+    )
+
+    assert game._wopr_turn()
+    assert game._discard_pile[-1] == ("Q", "♠")
+
+
+def test_wopr_knocks_on_post_discard_deadwood(monkeypatch):
+    """Test WOPR's knock decision uses the deadwood left after discarding."""
+    # 15 deadwood with the drawn Q♠, 5 once it is thrown
+    cards = ["A♣", "2♣", "3♣", "K♥", "K♦", "K♠", "5♦", "6♦", "7♦", "5♥"]
+
+    monkeypatch.setattr(random, "random", lambda: 0.0)
+    game = wopr_game(cards, "9♣", "Q♠")
+    assert game._wopr_turn()
+    assert game._discard_pile[-1] == ("Q", "♠")
+
+    monkeypatch.setattr(random, "random", lambda: 0.99)
+    game = wopr_game(cards, "9♣", "Q♠")
+    assert not game._wopr_turn()
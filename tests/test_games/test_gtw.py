@@ -5,6 +5,7 @@ from wopr.games.military.thermonuclear_war.game import GlobalThermonuclearWar
 from wopr.games.military.thermonuclear_war.targets import TargetDatabase, Target
 from wopr.games.military.thermonuclear_war.simulation import WarSimulation
 from wopr.games.military.thermonuclear_war.map import WorldMap
+from wopr.games.military.thermonuclear_war.drawille_map import DrawilleWarMap
 
 
 class MockIO:
@@ -27,6 +28,31 @@ class MockIO:
         return "".join(self.output)
 
 
+class TestDrawilleWarMap:
+    """Tests for the Drawille missile map."""
+
+    def test_arc_points_are_immutable(self):
+        """Test the cached arc is handed out as a tuple."""
+        war_map = DrawilleWarMap()
+        missile = war_map.add_missile("US_CENTER", "MOSCOW")
+
+        assert isinstance(missile.get_arc_points(), tuple)
+        assert missile.get_arc_points() == missile.get_arc_points()
+
+    def test_replaced_missiles_draw_their_own_arcs(self):
+        """Test missiles replaced without clear() don't reuse old arcs."""
+        war_map = DrawilleWarMap()
+        war_map.add_missile("US_CENTER", "MOSCOW")
+        war_map.render_frame()
+        war_map.missiles = []
+        war_map.add_missile("USSR_CENTER", "NEW_YORK")
+
+        fresh_map = DrawilleWarMap()
+        fresh_map.add_missile("USSR_CENTER", "NEW_YORK")
+
+        assert war_map.render_frame() == fresh_map.render_frame()
+
+
 class TestTargetDatabase:
     """Tests for target database."""
 
@@ -0,0 +1,132 @@
+"""Tests for Poker game logic."""
+
+import pytest
+
+from wopr.games.base import GameResult
+from wopr.games.cards.poker import Poker
+
+
+def hand(*cards: str) -> list[tuple[str, str]]:
+    """Build a hand from strings like "A♠" or "10♥"."""
+    return [(card[:-1], card[-1]) for card in cards]
+
+
+def test_hand_categories():
+    """Test each hand category is recognised."""
+    game = Poker(lambda x: None, lambda: "")
+
+    cases = [
+        (hand("A♠", "K♠", "Q♠", "J♠", "10♠"), "ROYAL FLUSH"),
+        (hand("9♥", "8♥", "7♥", "6♥", "5♥"), "STRAIGHT FLUSH"),
+        (hand("7♠", "7♥", "7♦", "7♣", "2♠"), "FOUR OF A KIND"),
+        (hand("3♠", "3♥", "3♦", "9♣", "9♠"), "FULL HOUSE"),
+        (hand("A♦", "J♦", "8♦", "4♦", "2♦"), "FLUSH"),
+        (hand("10♠", "9♥", "8♦", "7♣", "6♠"), "STRAIGHT"),
+        (hand("Q♠", "Q♥", "Q♦", "5♣", "2♠"), "THREE OF A KIND"),
+        (hand("J♠", "J♥", "4♦", "4♣", "A♠"), "TWO PAIR"),
+        (hand("8♠", "8♥", "K♦", "5♣", "2♠"), "ONE PAIR"),
+        (hand("A♠", "J♥", "8♦", "5♣", "2♠"), "HIGH CARD"),
+    ]
+    for cards, name in cases:
+        assert game.HAND_RANKS[game._evaluate_hand(cards)[0]] == name
+
+
+def test_wheel():
+    """Test A-2-3-4-5 is a five-high straight, below a six-high one."""
+    game = Poker(lambda x: None, lambda: "")
+
+    wheel = game._evaluate_hand(hand("A♠", "2♥", "3♦", "4♣", "5♠"))
+    six_high = game._evaluate_hand(hand("2♠", "3♥", "4♦", "5♣", "6♠"))
+
+    assert game.HAND_RANKS[wheel[0]] == "STRAIGHT"
+    assert wheel[1][0] == 5
+    assert six_high > wheel
+
+    steel_wheel = game._evaluate_hand(hand("A♥", "2♥", "3♥", "4♥", "5♥"))
+    assert game.HAND_RANKS[steel_wheel[0]] == "STRAIGHT FLUSH"
+
+
+def test_hand_ordering():
+    """Test stronger hands compare higher."""
+    game = Poker(lambda x: None, lambda: "")
+
+    royal = game._evaluate_hand(hand("A♣", "K♣", "Q♣", "J♣", "10♣"))
+    straight_flush = game._evaluate_hand(hand("K♦", "Q♦", "J♦", "10♦", "9♦"))
+    assert royal > straight_flush
+
+    full_house = game._evaluate_hand(hand("2♠", "2♥", "2♦", "3♣", "3♠"))
+    flush = game._evaluate_hand(hand("A♥", "K♥", "Q♥", "J♥", "9♥"))
+    assert full_house > flush
+
+
+def test_pair_beats_lower_pair_with_higher_kicker():
+    """Test the paired rank decides before kickers do."""
+    game = Poker(lambda x: None, lambda: "")
+
+    kings = game._evaluate_hand(hand("K♠", "K♥", "5♦", "4♣", "3♠"))
+    twos_ace_kicker = game._evaluate_hand(hand("2♠", "2♥", "A♦", "Q♣", "J♠"))
+    assert kings > twos_ace_kicker
+
+    # Same pair: the kickers decide
+    kings_ace_kicker = game._evaluate_hand(hand("K♦", "K♣", "A♠", "4♥", "3♦"))
+    assert kings_ace_kicker > kings
+
+    # Identical ranks in different suits tie
+    kings_other_suits = game._evaluate_hand(hand("K♦", "K♣", "5♠", "4♥", "3♦"))
+    assert kings_other_suits == kings
+
+
+class MockIO:
+    def __init__(self, inputs: list[str]):
+        self.inputs = inputs.copy()
+        self.input_index = 0
+        self.output = []
+
+    async def output_callback(self, text: str) -> None:
+        self.output.append(text)
+
+    async def input_callback(self) -> str:
+        if self.input_index < len(self.inputs):
+            result = self.inputs[self.input_index]
+            self.input_index += 1
+            return result
+        return "QUIT"
+
+    def get_output(self) -> str:
+        return "".join(self.output)
+
+
+@pytest.mark.asyncio
+async def test_discard_commands():
+    """Test discard positions may be separated by commas or spaces."""
+    for command in ["DISCARD 1,2", "DISCARD 1 2", "1, 2", "discard 1 2"]:
+        io = MockIO([command, "QUIT"])
+        game = Poker(io.output_callback, io.input_callback)
+        await game.play()
+
+        assert "DREW 2 NEW CARDS" in io.get_output()
+
+
+@pytest.mark.asyncio
+async def test_discard_phase_commands():
+    """Test KEEP, an empty line, unreadable input and FOLD in the discard phase."""
+    io = MockIO(["KEEP", "", "1 X", "FOLD", "QUIT"])
+    game = Poker(io.output_callback, io.input_callback)
+    result = await game.play()
+
+    output = io.get_output()
+    assert "DREW" not in output
+    assert output.count("KEEPING ALL CARDS") == 1
+    assert "YOU FOLD" in output
+    assert result["result"] == GameResult.QUIT
+
+
+@pytest.mark.asyncio
+async def test_discard_repeated_and_out_of_range_positions():
+    """Test repeated positions draw once and out-of-range ones are ignored."""
+    io = MockIO(["DISCARD 1,1", "2,9,0,2", "QUIT"])
+    game = Poker(io.output_callback, io.input_callback)
+    await game.play()
+
+    output = io.get_output()
+    assert output.count("DREW 1 NEW CARDS") == 2
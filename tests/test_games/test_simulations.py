@@ -0,0 +1,112 @@
+"""Tests for the military simulations."""
+
+import random
+
+import pytest
+
+from wopr.games.base import GameResult
+from wopr.games.military.simulations import MilitarySimulation
+
+
+class MockIO:
+    def __init__(self, inputs: list[str]):
+        self.inputs = inputs.copy()
+        self.input_index = 0
+        self.output = []
+
+    async def output_callback(self, text: str) -> None:
+        self.output.append(text)
+
+    async def input_callback(self) -> str:
+        if self.input_index < len(self.inputs):
+            result = self.inputs[self.input_index]
+            self.input_index += 1
+            return result
+        return "Q"
+
+    def get_output(self) -> str:
+        return "".join(self.output)
+
+
+@pytest.mark.asyncio
+async def test_several_commands_on_one_line(monkeypatch):
+    """Test a line of commands plays one turn per command."""
+    monkeypatch.setattr(random, "randrange", lambda *args: 99)  # enemy always misses
+    io = MockIO(["2 4 3", "Q"])
+
+    game = MilitarySimulation("FIGHTER COMBAT", io.output_callback, io.input_callback, pacing=0)
+    result = await game.play()
+
+    output = io.get_output()
+    assert result["result"] == GameResult.QUIT
+    assert io.input_index == 2
+    assert "DIVING TO ENGAGE" in output
+    assert "OUT OF RANGE" in output
+    assert "TURNING TO ENGAGE" in output
+    assert "TURN 4" in output
+    assert "TURN 5" not in output
+
+
+@pytest.mark.asyncio
+async def test_blank_line_is_one_command():
+    """Test an empty line still counts as one (no-op) command."""
+    io = MockIO(["", "Q"])
+
+    game = MilitarySimulation("FIGHTER COMBAT", io.output_callback, io.input_callback, pacing=0)
+    result = await game.play()
+
+    output = io.get_output()
+    assert result["result"] == GameResult.QUIT
+    assert io.input_index == 2
+    assert "TURN 2" in output
+    assert "TURN 3" not in output
+
+
+@pytest.mark.asyncio
+async def test_front_and_amount_on_one_line():
+    """Test a front and its amount can be given together."""
+    io = MockIO(["N 30", "Q"])
+
+    game = MilitarySimulation(
+        "THEATERWIDE TACTICAL WARFARE", io.output_callback, io.input_callback, pacing=0
+    )
+    await game.play()
+
+    output = io.get_output()
+    assert io.input_index == 2
+    assert "REINFORCED NORTH" in output
+    assert "RESERVES: [█████████░]  90" in output  # 100 - 30 + 20
+
+
+@pytest.mark.asyncio
+async def test_queued_order_is_not_taken_as_amount():
+    """Test a queued front order is not consumed as the previous front's amount."""
+    io = MockIO(["N C", "30", "Q"])
+
+    game = MilitarySimulation(
+        "THEATERWIDE TACTICAL WARFARE", io.output_callback, io.input_callback, pacing=0
+    )
+    await game.play()
+
+    output = io.get_output()
+    assert io.input_index == 3
+    assert "REINFORCED NORTH" not in output
+    assert "NO REINFORCEMENTS SENT TO NORTH" in output
+    assert "REINFORCED CENTER" in output
+
+
+@pytest.mark.asyncio
+async def test_type_ahead_hint_matches_game():
+    """Test the type-ahead example shown fits the simulation's orders."""
+    io = MockIO(["Q"])
+    game = MilitarySimulation("FIGHTER COMBAT", io.output_callback, io.input_callback, pacing=0)
+    await game.play()
+    assert '"2 4 3"' in io.get_output()
+    assert "N 30" not in io.get_output()
+
+    io = MockIO(["Q"])
+    game = MilitarySimulation(
+        "THEATERWIDE TACTICAL WARFARE", io.output_callback, io.input_callback, pacing=0
+    )
+    await game.play()
+    assert '"N 30"' in io.get_output()
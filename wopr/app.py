@@ -6,6 +6,7 @@ from textual.widgets import Static, Input
 from textual.binding import Binding
 from textual import events, on
 import asyncio
+import sys
 
 from .config import WOPRConfig, COLOR_SCHEMES, APP_TITLE
 from .core.state import GameState, WOPRStateMachine
@@ -525,7 +526,8 @@ class WOPRApp(App):
         game = MilitarySimulation(
             game_name=game_name,
             output_callback=self._output,
-            input_callback=self._get_input
+            input_callback=self._get_input,
+            pacing=1.0 if self._config.display.animations else 0,
         )
         await game.play()
 
@@ -534,6 +536,21 @@ class WOPRApp(App):
         self.exit()
 
 
+def _install_uvloop() -> None:
+    """Use uvloop for the event loop when it is installed (optional speedup).
+
+    Event loop policies are deprecated from Python 3.14, so from there on
+    the default asyncio loop is kept.
+    """
+    if sys.version_info >= (3, 14):
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def run_app(
     skip_intro: bool = False,
     no_sound: bool = False,
@@ -560,4 +577,5 @@ def run_app(
         start_game=start_game,
         debug=debug,
     )
+    _install_uvloop()
     app.run()
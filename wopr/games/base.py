@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Callable, Awaitable, Any
 from enum import Enum, auto
+from itertools import product
 
 
 class GameResult(Enum):
@@ -15,6 +16,10 @@ class GameResult(Enum):
     NONE = auto()  # For games like GTW where there's no winner
 
 
+class PlayerQuit(Exception):
+    """Raised when the player quits from inside a game's turn loop."""
+
+
 @dataclass
 class GameOutcome:
     """Result of a completed game."""
@@ -54,9 +59,14 @@ class BaseGame(ABC):
         self._audio = audio
         self._running = False
 
-    async def output(self, text: str) -> None:
-        """Display text to the user."""
-        await self._output(text)
+    def output(self, text: str) -> Awaitable[None]:
+        """Display text to the user.
+
+        Hands back the callback's awaitable rather than wrapping it in a
+        coroutine of its own, so each ``await self.output(...)`` costs one
+        frame instead of two.
+        """
+        return self._output(text)
 
     async def input(self, prompt: str = "") -> str:
         """Get input from the user."""
@@ -99,6 +109,21 @@ class CardGame(BaseGame):
 
     SUITS = ["♠", "♥", "♦", "♣"]
     RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+    # Every card built once; each shuffle copies these shared tuples
+    FULL_DECK = tuple((rank, suit) for suit, rank in product(SUITS, RANKS))
+    # Display string for every card, formatted once
+    CARD_STRS = {card: f"{card[0]}{card[1]}" for card in FULL_DECK}
+    # ASCII art rows for every card face, laid out once
+    CARD_ART = {
+        card: (
+            "┌───────┐",
+            f"│{card[0]:<7}│",
+            f"│   {card[1]}   │",
+            f"│{card[0]:>7}│",
+            "└───────┘",
+        )
+        for card in FULL_DECK
+    }
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
@@ -108,7 +133,7 @@ class CardGame(BaseGame):
     def _shuffle_deck(self) -> None:
         """Create and shuffle a new deck."""
         import random
-        self._deck = [(rank, suit) for suit in self.SUITS for rank in self.RANKS]
+        self._deck = list(self.FULL_DECK)
         random.shuffle(self._deck)
 
     def _draw_card(self) -> tuple[str, str] | None:
@@ -119,7 +144,8 @@ class CardGame(BaseGame):
 
     def _card_str(self, card: tuple[str, str]) -> str:
         """Convert a card to string representation."""
-        return f"{card[0]}{card[1]}"
+        text = self.CARD_STRS.get(card)
+        return text if text is not None else f"{card[0]}{card[1]}"
 
     def _hand_str(self, hand: list[tuple[str, str]]) -> str:
         """Convert a hand to string representation."""
@@ -171,11 +197,13 @@ class CardGame(BaseGame):
 
         hidden_indices = hidden_indices or set()
 
-        # Render each card
+        # Render each card, using the prebuilt art for standard faces
         card_renders = []
         for i, card in enumerate(hand):
-            is_hidden = i in hidden_indices
-            card_renders.append(self._render_card_art(card, hidden=is_hidden))
+            art = None if i in hidden_indices else self.CARD_ART.get(card)
+            if art is None:
+                art = self._render_card_art(card, hidden=i in hidden_indices)
+            card_renders.append(art)
 
         # Combine horizontally with spacing
         lines = []
@@ -185,9 +213,8 @@ class CardGame(BaseGame):
             num_line = "  ".join(f"    {i + 1}    " for i in range(len(hand)))
             lines.append(num_line)
 
-        for row in range(5):
-            line = "  ".join(render[row] for render in card_renders)
-            lines.append(line)
+        # zip() walks the cards row by row
+        lines.extend("  ".join(row) for row in zip(*card_renders))
 
         return "\n".join(lines)
 
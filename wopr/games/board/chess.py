@@ -1,7 +1,15 @@
 """Chess game for WOPR using python-chess."""
 
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Any
 import asyncio
+import multiprocessing
+import os
+import re
+import shutil
 
 from ..base import BaseGame, GameResult
 
@@ -12,6 +20,102 @@ try:
 except ImportError:
     CHESS_AVAILABLE = False
 
+# Coordinate (UCI) move such as e2e4 or e7e8q
+_UCI_RE = re.compile(r"^[a-h][1-8][a-h][1-8][qrbn]?$", re.IGNORECASE)
+
+# Material values indexed by piece type (chess.PAWN == 1 .. chess.KING == 6)
+_PIECE_VALUES = (0, 100, 320, 330, 500, 900, 20000)
+
+
+def _evaluate_board(board: chess.Board) -> int:
+    """Simple board evaluation."""
+    if board.is_checkmate():
+        return -99999 if board.turn else 99999
+    if board.is_stalemate() or board.is_insufficient_material():
+        return 0
+
+    # Material balance from per-piece-type bitboards (WOPR plays black)
+    white = board.occupied_co[chess.WHITE]
+    black = board.occupied_co[chess.BLACK]
+    score = 0
+    for mask, piece_type in (
+        (board.pawns, chess.PAWN),
+        (board.knights, chess.KNIGHT),
+        (board.bishops, chess.BISHOP),
+        (board.rooks, chess.ROOK),
+        (board.queens, chess.QUEEN),
+        (board.kings, chess.KING),
+    ):
+        count = (mask & black).bit_count() - (mask & white).bit_count()
+        score += _PIECE_VALUES[piece_type] * count
+    return score
+
+
+def _quiescence(board: chess.Board, alpha: int, beta: int, maximizing: bool) -> int:
+    """Extend the search through captures until the position is quiet."""
+    stand_pat = _evaluate_board(board)
+    if maximizing:
+        if stand_pat >= beta:
+            return stand_pat
+        alpha = max(alpha, stand_pat)
+        for move in board.generate_legal_captures():
+            board.push(move)
+            eval_score = _quiescence(board, alpha, beta, False)
+            board.pop()
+            if eval_score >= beta:
+                return eval_score
+            alpha = max(alpha, eval_score)
+        return alpha
+    else:
+        if stand_pat <= alpha:
+            return stand_pat
+        beta = min(beta, stand_pat)
+        for move in board.generate_legal_captures():
+            board.push(move)
+            eval_score = _quiescence(board, alpha, beta, True)
+            board.pop()
+            if eval_score <= alpha:
+                return eval_score
+            beta = min(beta, eval_score)
+        return beta
+
+
+def _minimax(board: chess.Board, depth: int, alpha: int, beta: int, maximizing: bool) -> int:
+    """Minimax with alpha-beta pruning."""
+    if board.is_game_over():
+        return _evaluate_board(board)
+    if depth == 0:
+        return _quiescence(board, alpha, beta, maximizing)
+
+    if maximizing:
+        max_eval = -999999
+        for move in board.legal_moves:
+            board.push(move)
+            eval_score = _minimax(board, depth - 1, alpha, beta, False)
+            board.pop()
+            max_eval = max(max_eval, eval_score)
+            alpha = max(alpha, eval_score)
+            if beta <= alpha:
+                break
+        return max_eval
+    else:
+        min_eval = 999999
+        for move in board.legal_moves:
+            board.push(move)
+            eval_score = _minimax(board, depth - 1, alpha, beta, True)
+            board.pop()
+            min_eval = min(min_eval, eval_score)
+            beta = min(beta, eval_score)
+            if beta <= alpha:
+                break
+        return min_eval
+
+
+def _score_root_move(board: chess.Board, move: chess.Move, depth: int) -> int:
+    """Score one of WOPR's candidate moves (runs in a worker process)."""
+    board.push(move)
+    return _minimax(board, depth, -999999, 999999, False)
+
 
 class ChessGame(BaseGame):
     """Chess game against WOPR."""
@@ -42,6 +146,13 @@ Commands: QUIT, RESIGN, BOARD, HELP
         "k": "k", "q": "q", "r": "r", "b": "b", "n": "n", "p": "p",
     }
 
+    # Static board frame, shared by every redraw
+    _FILE_HEADER = "       a     b     c     d     e     f     g     h"
+    _FRAME_TOP = "    ╔═════╤═════╤═════╤═════╤═════╤═════╤═════╤═════╗"
+    _FRAME_PAD = "    ║" + "│".join(["     "] * 8) + "║"
+    _FRAME_SEP = "    ╟─────┼─────┼─────┼─────┼─────┼─────┼─────┼─────╢"
+    _FRAME_BOTTOM = "    ╚═════╧═════╧═════╧═════╧═════╧═════╧═════╧═════╝"
+
     def __init__(
         self,
         output_callback,
@@ -53,6 +164,9 @@ Commands: QUIT, RESIGN, BOARD, HELP
         self._difficulty = max(1, min(5, difficulty))
         self._board = None
         self._use_unicode = True
+        self._engine = None
+        self._engine_unavailable = False
+        self._pool: ProcessPoolExecutor | None = None
 
     def _render_board(self) -> str:
         """Render the chess board as ASCII with larger cells."""
@@ -60,125 +174,109 @@ Commands: QUIT, RESIGN, BOARD, HELP
             return ""
 
         pieces = self.PIECES if self._use_unicode else self.ASCII_PIECES
-        lines = []
-        lines.append("")
-        lines.append("       a     b     c     d     e     f     g     h")
-        lines.append("    ╔═════╤═════╤═════╤═════╤═════╤═════╤═════╤═════╗")
+        lines = ["", self._FILE_HEADER, self._FRAME_TOP]
 
         for rank in range(7, -1, -1):
-            # Top of cell row (empty padding)
-            padding_row = "    ║"
-            for file in range(8):
-                padding_row += "     "
-                padding_row += "│" if file < 7 else "║"
-            lines.append(padding_row)
-
-            # Middle row with piece
-            row = f"  {rank + 1} ║"
+            cells = []
             for file in range(8):
-                square = chess.square(file, rank)
-                piece = self._board.piece_at(square)
+                piece = self._board.piece_at(chess.square(file, rank))
                 if piece:
                     symbol = pieces.get(piece.symbol(), piece.symbol())
                 else:
                     # Checkerboard pattern
                     symbol = "·" if (rank + file) % 2 == 0 else " "
-                row += f"  {symbol}  "
-                row += "│" if file < 7 else "║"
-            lines.append(row + f"  {rank + 1}")
+                cells.append(f"  {symbol}  ")
 
-            # Bottom of cell row (empty padding)
-            padding_row = "    ║"
-            for file in range(8):
-                padding_row += "     "
-                padding_row += "│" if file < 7 else "║"
-            lines.append(padding_row)
+            lines.append(self._FRAME_PAD)
+            lines.append(f"  {rank + 1} ║" + "│".join(cells) + f"║  {rank + 1}")
+            lines.append(self._FRAME_PAD)
 
             if rank > 0:
-                lines.append("    ╟─────┼─────┼─────┼─────┼─────┼─────┼─────┼─────╢")
+                lines.append(self._FRAME_SEP)
 
-        lines.append("    ╚═════╧═════╧═════╧═════╧═════╧═════╧═════╧═════╝")
-        lines.append("       a     b     c     d     e     f     g     h")
-        lines.append("")
+        lines.extend((self._FRAME_BOTTOM, self._FILE_HEADER, ""))
         return "\n".join(lines)
 
-    def _get_wopr_move(self) -> chess.Move | None:
-        """Calculate WOPR's move using simple evaluation."""
+    async def _get_wopr_move(self) -> chess.Move | None:
+        """Calculate WOPR's move using simple evaluation.
+
+        Root moves are independent subtrees, so each is searched in its
+        own worker process.
+        """
         if not self._board:
             return None
 
-        # Piece values for basic evaluation
-        piece_values = {
-            chess.PAWN: 100,
-            chess.KNIGHT: 320,
-            chess.BISHOP: 330,
-            chess.ROOK: 500,
-            chess.QUEEN: 900,
-            chess.KING: 20000
-        }
-
-        def evaluate_board(board: chess.Board) -> int:
-            """Simple board evaluation."""
-            if board.is_checkmate():
-                return -99999 if board.turn else 99999
-            if board.is_stalemate() or board.is_insufficient_material():
-                return 0
-
-            score = 0
-            for square in chess.SQUARES:
-                piece = board.piece_at(square)
-                if piece:
-                    value = piece_values.get(piece.piece_type, 0)
-                    if piece.color == chess.WHITE:
-                        score -= value  # WOPR plays black
-                    else:
-                        score += value
-            return score
-
-        def minimax(board: chess.Board, depth: int, alpha: int, beta: int, maximizing: bool) -> int:
-            """Minimax with alpha-beta pruning."""
-            if depth == 0 or board.is_game_over():
-                return evaluate_board(board)
-
-            if maximizing:
-                max_eval = -999999
-                for move in board.legal_moves:
-                    board.push(move)
-                    eval_score = minimax(board, depth - 1, alpha, beta, False)
-                    board.pop()
-                    max_eval = max(max_eval, eval_score)
-                    alpha = max(alpha, eval_score)
-                    if beta <= alpha:
-                        break
-                return max_eval
-            else:
-                min_eval = 999999
-                for move in board.legal_moves:
-                    board.push(move)
-                    eval_score = minimax(board, depth - 1, alpha, beta, True)
-                    board.pop()
-                    min_eval = min(min_eval, eval_score)
-                    beta = min(beta, eval_score)
-                    if beta <= alpha:
-                        break
-                return min_eval
-
-        # Search depth based on difficulty
-        depth = self._difficulty + 1
-
-        best_move = None
-        best_score = -999999
-
-        for move in self._board.legal_moves:
-            self._board.push(move)
-            score = minimax(self._board, depth, -999999, 999999, False)
-            self._board.pop()
-
-            if score > best_score:
-                best_score = score
-                best_move = move
-
-        return best_move
+        moves = list(self._board.legal_moves)
+        if not moves:
+            return None
+
+        # Search depth based on difficulty; quiescence covers the horizon
+        depth = self._difficulty
+
+        if self._pool is None:
+            # Spawn rather than fork: forking the running app, with its live
+            # threads, can deadlock the worker
+            self._pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        loop = asyncio.get_running_loop()
+        try:
+            scores = await asyncio.gather(*(
+                loop.run_in_executor(self._pool, _score_root_move, self._board.copy(), move, depth)
+                for move in moves
+            ))
+        except (OSError, BrokenProcessPool):
+            # No usable worker processes; drop the pool so the next move starts
+            # a fresh one, and search in threads to keep the event loop free
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            scores = await asyncio.gather(*(
+                asyncio.to_thread(_score_root_move, self._board.copy(), move, depth)
+                for move in moves
+            ))
+
+        best_index = max(range(len(moves)), key=scores.__getitem__)
+        return moves[best_index]
+
+    async def _get_engine_move(self) -> chess.Move | None:
+        """Ask a local UCI engine (Stockfish) for WOPR's move.
+
+        Returns None when no engine is installed or it fails, in which case
+        the built-in minimax is used instead.
+        """
+        if self._engine_unavailable or not self._board:
+            return None
+
+        try:
+            if self._engine is None:
+                path = shutil.which("stockfish")
+                if not path:
+                    self._engine_unavailable = True
+                    return None
+                _, self._engine = await chess.engine.popen_uci(path)
+                if "Skill Level" in self._engine.options:
+                    await self._engine.configure({"Skill Level": self._difficulty * 4})
+
+            result = await self._engine.play(
+                self._board, chess.engine.Limit(depth=self._difficulty + 1)
+            )
+            return result.move
+        except (OSError, chess.engine.EngineError):
+            self._engine_unavailable = True
+            await self._close_engine()
+            return None
+
+    async def _close_engine(self) -> None:
+        """Shut down the UCI engine if one was started."""
+        if self._engine is None:
+            return
+        engine, self._engine = self._engine, None
+        try:
+            await engine.quit()
+        except chess.engine.EngineError:
+            pass
 
     async def play(self) -> dict[str, Any]:
         """Play the game."""
@@ -187,6 +285,16 @@ Commands: QUIT, RESIGN, BOARD, HELP
             await self.output("Install with: pip3 install python-chess\n")
             return {"result": GameResult.QUIT}
 
+        try:
+            return await self._play_game()
+        finally:
+            await self._close_engine()
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    async def _play_game(self) -> dict[str, Any]:
+        """Run the game loop until it ends."""
         await self.show_instructions()
         self._board = chess.Board()
         self._running = True
@@ -226,26 +334,27 @@ Commands: QUIT, RESIGN, BOARD, HELP
                         move = self._board.parse_san("O-O")
                     elif cmd in {"O-O-O", "0-0-0"}:
                         move = self._board.parse_san("O-O-O")
-                    else:
-                        # Try UCI notation first, then SAN
-                        try:
-                            move = chess.Move.from_uci(move_str.lower())
-                            if move not in self._board.legal_moves:
-                                raise ValueError()
-                        except:
+                    elif _UCI_RE.match(move_str.strip()):
+                        # Coordinate notation first, then SAN
+                        move = chess.Move.from_uci(move_str.strip().lower())
+                        if move not in self._board.legal_moves:
                             move = self._board.parse_san(move_str)
+                    else:
+                        move = self._board.parse_san(move_str)
 
                     self._board.push(move)
-                except Exception:
+                except ValueError:
                     await self.output("ILLEGAL MOVE\n")
                     continue
 
             # WOPR's turn (Black)
             else:
                 await self.output("WOPR IS THINKING...\n")
-                await asyncio.sleep(0.5)
 
-                move = self._get_wopr_move()
+                move = await self._get_engine_move()
+                if move is None:
+                    await asyncio.sleep(0.5)
+                    move = await self._get_wopr_move()
                 if move:
                     self._board.push(move)
                     await self.output(f"WOPR PLAYS: {move.uci()}\n")
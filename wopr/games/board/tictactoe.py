@@ -6,6 +6,25 @@ import random
 
 from ..base import BaseGame, GameResult
 
+# Rows, columns and diagonals as indices into the flattened 3x3 board
+WIN_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6),
+)
+
+# Cell permutations for the 8 board symmetries (rotations and reflections)
+SYMMETRIES = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # identity
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # rotate 90
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # rotate 180
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # rotate 270
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # mirror left-right
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # mirror top-bottom
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # main diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # anti-diagonal
+)
+
 
 class TicTacToe(BaseGame):
     """Tic-Tac-Toe game."""
@@ -21,6 +40,13 @@ Example: 1,1 for top-left, 2,2 for center
 Win by getting three in a row horizontally, vertically, or diagonally.
 """
 
+    # Static board frame, shared by every redraw
+    _COL_HEADER = "          1         2         3"
+    _FRAME_TOP = "     ┌─────────┬─────────┬─────────┐"
+    _FRAME_PAD = "     │         │         │         │"
+    _FRAME_SEP = "     ├─────────┼─────────┼─────────┤"
+    _FRAME_BOTTOM = "     └─────────┴─────────┴─────────┘"
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._board = [[" " for _ in range(3)] for _ in range(3)]
@@ -29,43 +55,25 @@ Win by getting three in a row horizontally, vertically, or diagonally.
 
     def _render_board(self) -> str:
         """Render the tic-tac-toe board with larger cells."""
-        lines = []
-        lines.append("")
-        lines.append("          1         2         3")
-        lines.append("     ┌─────────┬─────────┬─────────┐")
+        lines = ["", self._COL_HEADER, self._FRAME_TOP]
         for i, row in enumerate(self._board):
-            # Top padding
-            lines.append("     │         │         │         │")
-            # Middle row with X or O
+            if i:
+                lines.append(self._FRAME_SEP)
+            lines.append(self._FRAME_PAD)
             lines.append(f"  {i + 1}  │    {row[0]}    │    {row[1]}    │    {row[2]}    │")
-            # Bottom padding
-            lines.append("     │         │         │         │")
-            if i < 2:
-                lines.append("     ├─────────┼─────────┼─────────┤")
-        lines.append("     └─────────┴─────────┴─────────┘")
-        lines.append("")
+            lines.append(self._FRAME_PAD)
+        lines.extend((self._FRAME_BOTTOM, ""))
         return "\n".join(lines)
 
     def _check_winner(self) -> str | None:
         """Check if there's a winner. Returns 'X', 'O', 'DRAW', or None."""
-        # Check rows
-        for row in self._board:
-            if row[0] == row[1] == row[2] != " ":
-                return row[0]
-
-        # Check columns
-        for col in range(3):
-            if self._board[0][col] == self._board[1][col] == self._board[2][col] != " ":
-                return self._board[0][col]
-
-        # Check diagonals
-        if self._board[0][0] == self._board[1][1] == self._board[2][2] != " ":
-            return self._board[0][0]
-        if self._board[0][2] == self._board[1][1] == self._board[2][0] != " ":
-            return self._board[0][2]
+        cells = [cell for row in self._board for cell in row]
+        for a, b, c in WIN_LINES:
+            if cells[a] == cells[b] == cells[c] != " ":
+                return cells[a]
 
         # Check for draw
-        if all(self._board[r][c] != " " for r in range(3) for c in range(3)):
+        if " " not in cells:
             return "DRAW"
 
         return None
@@ -79,8 +87,31 @@ Win by getting three in a row horizontally, vertically, or diagonally.
             if self._board[r][c] == " "
         ]
 
-    def _minimax(self, is_maximizing: bool, depth: int = 0) -> tuple[int, tuple[int, int] | None]:
-        """Minimax algorithm for optimal play."""
+    def _canonical_key(self) -> str:
+        """Return the board's canonical form under the 8 board symmetries."""
+        cells = "".join(cell for row in self._board for cell in row)
+        return min("".join(cells[i] for i in perm) for perm in SYMMETRIES)
+
+    def _child_score(self, is_maximizing: bool, depth: int, cache: dict[str, int]) -> int:
+        """Score the current position, sharing results between symmetric boards."""
+        key = self._canonical_key()
+        score = cache.get(key)
+        if score is None:
+            score, _ = self._minimax(is_maximizing, depth, cache)
+            cache[key] = score
+        return score
+
+    def _minimax(
+        self,
+        is_maximizing: bool,
+        depth: int = 0,
+        cache: dict[str, int] | None = None,
+    ) -> tuple[int, tuple[int, int] | None]:
+        """Minimax algorithm for optimal play.
+
+        Positions equivalent under rotation or reflection score the same,
+        so each symmetry class is searched once per call via ``cache``.
+        """
         winner = self._check_winner()
         if winner == self._computer:
             return 10 - depth, None
@@ -93,12 +124,15 @@ Win by getting three in a row horizontally, vertically, or diagonally.
         if not empty:
             return 0, None
 
+        if cache is None:
+            cache = {}
+
         best_move = None
         if is_maximizing:
             best_score = -100
             for r, c in empty:
                 self._board[r][c] = self._computer
-                score, _ = self._minimax(False, depth + 1)
+                score = self._child_score(False, depth + 1, cache)
                 self._board[r][c] = " "
                 if score > best_score:
                     best_score = score
@@ -107,7 +141,7 @@ Win by getting three in a row horizontally, vertically, or diagonally.
             best_score = 100
             for r, c in empty:
                 self._board[r][c] = self._player
-                score, _ = self._minimax(True, depth + 1)
+                score = self._child_score(True, depth + 1, cache)
                 self._board[r][c] = " "
                 if score < best_score:
                     best_score = score
@@ -183,25 +217,24 @@ Win by getting three in a row horizontally, vertically, or diagonally.
 class TicTacToeLearning:
     """Demonstrates WOPR learning that tic-tac-toe is unwinnable."""
 
+    # Precomposed compact board; only the nine cells vary per frame
+    _MINI_BOARD = (
+        " %s | %s | %s \n"
+        "---+---+---\n"
+        " %s | %s | %s \n"
+        "---+---+---\n"
+        " %s | %s | %s \n"
+    )
+
     def __init__(self, output_callback: Callable[[str], Awaitable[None]]) -> None:
         self._output = output_callback
 
     def _render_mini_board(self, board: list[str]) -> str:
         """Render a compact 3x3 board for rapid display."""
-        return (
-            f" {board[0]} | {board[1]} | {board[2]} \n"
-            f"---+---+---\n"
-            f" {board[3]} | {board[4]} | {board[5]} \n"
-            f"---+---+---\n"
-            f" {board[6]} | {board[7]} | {board[8]} \n"
-        )
+        return self._MINI_BOARD % tuple(board)
 
     async def run_demonstration(self) -> None:
         """Run the rapid tic-tac-toe learning demonstration."""
-        await self._output("\nANALYZING TIC-TAC-TOE...\n")
-        await self._output("=" * 50 + "\n\n")
-        await asyncio.sleep(0.5)
-
         # Show a few sample games with outcomes
         sample_games = [
             # Game 1: X wins (but this is suboptimal play)
@@ -215,30 +248,30 @@ class TicTacToeLearning:
             # Game 5: Draw
             (["X", "O", "X", "O", "O", "X", "X", "X", "O"], "DRAW"),
         ]
+        game_counts = [1000, 5000, 25000, 100000, 200000, 255168]
 
-        await self._output("SAMPLE GAMES:\n\n")
-
+        # Build the whole demonstration up front as (text, pause) frames
+        frames = [("\nANALYZING TIC-TAC-TOE...\n" + "=" * 50 + "\n\n", 0.5)]
+        frames.append(("SAMPLE GAMES:\n\n", 0))
         for i, (board, result) in enumerate(sample_games):
-            await self._output(f"Game {i + 1}:        Result: {result}\n")
-            await self._output(self._render_mini_board(board))
-            await self._output("\n")
-            await asyncio.sleep(0.3)
+            frames.append((
+                f"Game {i + 1}:        Result: {result}\n"
+                + self._render_mini_board(board)
+                + "\n",
+                0.3,
+            ))
 
         # Rapid analysis counter
-        await self._output("ANALYZING ALL POSSIBLE GAMES...\n\n")
-        game_counts = [1000, 5000, 25000, 100000, 200000, 255168]
-
+        frames.append(("ANALYZING ALL POSSIBLE GAMES...\n\n", 0))
         for count in game_counts:
-            await self._output(f"  Games analyzed: {count:,}...\n")
-            await asyncio.sleep(0.15)
-
-        await self._output("\n" + "=" * 50 + "\n")
-        await self._output("ANALYSIS COMPLETE\n")
-        await self._output("=" * 50 + "\n\n")
-        await asyncio.sleep(0.3)
-        await self._output("TOTAL GAMES ANALYZED: 255,168\n")
-        await asyncio.sleep(0.3)
-        await self._output("OPTIMAL PLAY RESULTS IN: DRAW\n")
-        await asyncio.sleep(0.3)
-        await self._output("POSSIBLE WINNER WITH OPTIMAL PLAY: NONE\n\n")
-        await asyncio.sleep(1.0)
+            frames.append((f"  Games analyzed: {count:,}...\n", 0.15))
+
+        frames.append(("\n" + "=" * 50 + "\nANALYSIS COMPLETE\n" + "=" * 50 + "\n\n", 0.3))
+        frames.append(("TOTAL GAMES ANALYZED: 255,168\n", 0.3))
+        frames.append(("OPTIMAL PLAY RESULTS IN: DRAW\n", 0.3))
+        frames.append(("POSSIBLE WINNER WITH OPTIMAL PLAY: NONE\n\n", 1.0))
+
+        for text, pause in frames:
+            await self._output(text)
+            if pause:
+                await asyncio.sleep(pause)
@@ -3,12 +3,7 @@
 from typing import Any
 import random
 
-from ..base import CardGame, GameResult
-
-
-class PlayerQuit(Exception):
-    """Raised when player wants to quit the game."""
-    pass
+from ..base import CardGame, GameResult, PlayerQuit
 
 
 class Blackjack(CardGame):
@@ -31,6 +26,20 @@ Commands:
 Dealer stands on 17.
 """
 
+    # Player commands and their aliases
+    _COMMANDS = {
+        "H": "hit", "HIT": "hit",
+        "S": "stand", "STAND": "stand",
+        "D": "double", "DOUBLE": "double",
+        "Q": "quit", "QUIT": "quit",
+    }
+
+    # Base value of each rank (aces count high until adjusted)
+    _RANK_VALUE = {
+        "A": 11, "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7,
+        "8": 8, "9": 9, "10": 10, "J": 10, "Q": 10, "K": 10,
+    }
+
     def __init__(self, *args, starting_chips: int = 100, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._chips = starting_chips
@@ -40,24 +49,24 @@ Dealer stands on 17.
 
     def _card_value(self, card: tuple[str, str]) -> int:
         """Get the value of a card."""
-        rank = card[0]
-        if rank in ["J", "Q", "K"]:
-            return 10
-        elif rank == "A":
-            return 11  # Will adjust for soft hands
-        else:
-            return int(rank)
+        return self._RANK_VALUE[card[0]]
 
     def _hand_value(self, hand: list[tuple[str, str]]) -> int:
         """Calculate the best value of a hand."""
-        value = sum(self._card_value(card) for card in hand)
-        aces = sum(1 for card in hand if card[0] == "A")
-
-        # Adjust for aces
-        while value > 21 and aces > 0:
-            value -= 10
-            aces -= 1
-
+        rank_value = self._RANK_VALUE
+        value = aces = 0
+        for rank, _ in hand:
+            value += rank_value[rank]
+            aces += rank == "A"
+
+        return self._best_total(value, aces)
+
+    @staticmethod
+    def _best_total(value: int, aces: int) -> int:
+        """Best total for a hand worth ``value`` with every ace counted as 11."""
+        # Count just enough aces as 1 to get back under 22
+        if value > 21:
+            value -= 10 * min(aces, (value - 12) // 10)
         return value
 
     def _render_card(self, card: tuple[str, str] | None, hidden: bool = False) -> list[str]:
@@ -119,28 +128,29 @@ Dealer stands on 17.
 
     async def _show_table(self, reveal_dealer: bool = False) -> None:
         """Display the current table state."""
-        await self.output("\n" + "═" * 60 + "\n")
-        await self.output(f"    CHIPS: {self._chips}        BET: {self._bet}\n")
-        await self.output("─" * 60 + "\n\n")
+        lines = [
+            "\n" + "═" * 60 + "\n",
+            f"    CHIPS: {self._chips}        BET: {self._bet}\n",
+            "─" * 60 + "\n\n",
+        ]
 
         # Dealer's hand
-        await self.output("    DEALER")
+        lines.append("    DEALER")
         if reveal_dealer:
-            await self.output(f"  (Total: {self._hand_value(self._dealer_hand)})")
-        await self.output("\n\n")
+            lines.append(f"  (Total: {self._hand_value(self._dealer_hand)})")
+        lines.append("\n\n")
         dealer_cards = self._render_hand(self._dealer_hand, hide_first=not reveal_dealer)
-        for line in dealer_cards.split("\n"):
-            await self.output(f"    {line}\n")
+        lines.extend(f"    {line}\n" for line in dealer_cards.split("\n"))
 
-        await self.output("\n" + "─" * 60 + "\n\n")
+        lines.append("\n" + "─" * 60 + "\n\n")
 
         # Player's hand
-        await self.output(f"    YOU  (Total: {self._hand_value(self._player_hand)})\n\n")
+        lines.append(f"    YOU  (Total: {self._hand_value(self._player_hand)})\n\n")
         player_cards = self._render_hand(self._player_hand)
-        for line in player_cards.split("\n"):
-            await self.output(f"    {line}\n")
+        lines.extend(f"    {line}\n" for line in player_cards.split("\n"))
 
-        await self.output("\n" + "═" * 60 + "\n")
+        lines.append("\n" + "═" * 60 + "\n")
+        await self.output("".join(lines))
 
     async def _player_turn(self) -> bool:
         """Handle player's turn. Returns True if player busts."""
@@ -154,17 +164,18 @@ Dealer stands on 17.
 
             await self.output("\n(H)IT, (S)TAND, (D)OUBLE, (Q)UIT: ")
             cmd = (await self._input()).strip().upper()
+            action = self._COMMANDS.get(cmd)
 
-            if cmd in {"H", "HIT"}:
+            if action == "hit":
                 card = self._draw_card()
                 self._player_hand.append(card)
                 await self.output(f"DREW: [{self._card_str(card)}]\n")
                 await self._show_table()
 
-            elif cmd in {"S", "STAND"}:
+            elif action == "stand":
                 return False
 
-            elif cmd in {"D", "DOUBLE"}:
+            elif action == "double":
                 if len(self._player_hand) == 2 and self._chips >= self._bet:
                     self._chips -= self._bet
                     self._bet *= 2
@@ -176,7 +187,7 @@ Dealer stands on 17.
                 else:
                     await self.output("CANNOT DOUBLE\n")
 
-            elif cmd in {"Q", "QUIT"}:
+            elif action == "quit":
                 raise PlayerQuit()
 
             else:
@@ -187,9 +198,18 @@ Dealer stands on 17.
         await self.output("\nDEALER'S TURN...\n")
         await self._show_table(reveal_dealer=True)
 
-        while self._hand_value(self._dealer_hand) < 17:
+        # Keep a running total so each draw only adds the new card
+        rank_value = self._RANK_VALUE
+        value = aces = 0
+        for rank, _ in self._dealer_hand:
+            value += rank_value[rank]
+            aces += rank == "A"
+
+        while self._best_total(value, aces) < 17:
             card = self._draw_card()
             self._dealer_hand.append(card)
+            value += rank_value[card[0]]
+            aces += card[0] == "A"
             await self.output(f"DEALER DRAWS: [{self._card_str(card)}]\n")
             await self._show_table(reveal_dealer=True)
 
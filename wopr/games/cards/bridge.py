@@ -3,12 +3,7 @@
 from typing import Any
 import random
 
-from ..base import CardGame, GameResult
-
-
-class PlayerQuit(Exception):
-    """Raised when player wants to quit the game."""
-    pass
+from ..base import CardGame, GameResult, PlayerQuit
 
 
 class Bridge(CardGame):
@@ -38,43 +33,72 @@ Commands: BID, PASS, PLAY, HAND, QUIT
     SUITS_ORDER = ["♣", "♦", "♥", "♠", "NT"]
     SUIT_NAMES = {"CLUBS": "♣", "DIAMONDS": "♦", "HEARTS": "♥", "SPADES": "♠",
                   "NO TRUMP": "NT", "NOTRUMP": "NT", "NT": "NT"}
+    SEAT_NAMES = ("YOU", "PARTNER", "EAST", "WEST")
+
+    # High card points by rank
+    _HCP = {"A": 4, "K": 3, "Q": 2, "J": 1}
+    # Bidding rank of each denomination (position in SUITS_ORDER)
+    _SUIT_RANK = {suit: i for i, suit in enumerate(SUITS_ORDER)}
+
+    # Sort positions for arranging a hand (suits low to high, then rank)
+    _SUIT_SORT = {"♣": 0, "♦": 1, "♥": 2, "♠": 3}
+    _RANK_ORDER = {
+        rank: i
+        for i, rank in enumerate(["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"])
+    }
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._hands: dict[int, list[tuple[str, str]]] = {}  # 0=player, 1=partner, 2=east, 3=west
+        self._by_suit: list[dict[str, list[tuple[str, str]]]] = []  # per-player cards by suit
+        self._points: list[int] = []  # per-player high card points for the current deal
         self._scores = [0, 0]  # [NS, EW]
         self._contract = None  # (level, suit, declarer)
         self._tricks_won = [0, 0]  # [NS, EW]
 
     def _card_value(self, card: tuple[str, str]) -> int:
         """Get numeric value for ordering."""
-        ranks = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
-        return ranks.index(card[0])
+        return self._RANK_ORDER[card[0]]
 
     def _deal_hands(self) -> None:
         """Deal 13 cards to each player."""
-        self._shuffle_deck()
+        deck = random.sample(self.FULL_DECK, len(self.FULL_DECK))
         for i in range(4):
-            self._hands[i] = [self._draw_card() for _ in range(13)]
-            self._hands[i].sort(key=lambda c: (["♣", "♦", "♥", "♠"].index(c[1]), self._card_value(c)))
+            self._hands[i] = sorted(
+                deck[i * 13:(i + 1) * 13],
+                key=lambda c: (self._SUIT_SORT[c[1]], self._RANK_ORDER[c[0]]),
+            )
+        # Hands are sorted, so each suit bucket is in rank order too
+        self._by_suit = [
+            {suit: [c for c in self._hands[i] if c[1] == suit] for suit in self._SUIT_SORT}
+            for i in range(4)
+        ]
+        # Hands don't change during bidding, so score them once per deal
+        self._points = [self._count_points(self._hands[i]) for i in range(4)]
+
+    def _play_card(self, player: int, pos: int) -> tuple[str, str]:
+        """Remove and return the card at ``pos`` in a player's hand."""
+        card = self._hands[player].pop(pos)
+        self._by_suit[player][card[1]].remove(card)
+        return card
+
+    def _suit_offset(self, player: int, suit: str) -> int:
+        """Position in a sorted hand where the given suit's cards begin."""
+        offset = 0
+        for other, cards in self._by_suit[player].items():
+            if other == suit:
+                break
+            offset += len(cards)
+        return offset
 
     def _count_points(self, hand: list[tuple[str, str]]) -> int:
         """Count high card points."""
-        points = 0
-        for card in hand:
-            if card[0] == "A":
-                points += 4
-            elif card[0] == "K":
-                points += 3
-            elif card[0] == "Q":
-                points += 2
-            elif card[0] == "J":
-                points += 1
-        return points
+        hcp = self._HCP
+        return sum(hcp.get(rank, 0) for rank, _ in hand)
 
     def _wopr_bid(self, player: int, current_bid: tuple[int, str] | None) -> tuple[int, str] | None:
         """WOPR makes a bid."""
-        points = self._count_points(self._hands[player])
+        points = self._points[player]
 
         if points < 12:
             return None  # Pass
@@ -90,16 +114,14 @@ Commands: BID, PASS, PLAY, HAND, QUIT
             level = 1
 
         # Find longest suit
-        suits = {"♣": 0, "♦": 0, "♥": 0, "♠": 0}
-        for card in self._hands[player]:
-            suits[card[1]] += 1
-
-        best_suit = max(suits.keys(), key=lambda s: (suits[s], self.SUITS_ORDER.index(s)))
+        by_suit = self._by_suit[player]
+        suit_rank = self._SUIT_RANK
+        best_suit = max(by_suit, key=lambda s: (len(by_suit[s]), suit_rank[s]))
 
         if current_bid:
             cur_level, cur_suit = current_bid
-            cur_suit_idx = self.SUITS_ORDER.index(cur_suit)
-            best_suit_idx = self.SUITS_ORDER.index(best_suit)
+            cur_suit_idx = suit_rank[cur_suit]
+            best_suit_idx = suit_rank[best_suit]
 
             if level > cur_level:
                 return (level, best_suit)
@@ -118,7 +140,7 @@ Commands: BID, PASS, PLAY, HAND, QUIT
     async def _bidding_phase(self) -> tuple[int, str, int] | None:
         """Run bidding phase. Returns (level, suit, declarer) or None if passed out."""
         await self.output("\n=== BIDDING ===\n")
-        await self.output(f"YOUR HAND ({self._count_points(self._hands[0])} HCP):\n")
+        await self.output(f"YOUR HAND ({self._points[0]} HCP):\n")
         await self.output(self._render_hand(self._hands[0]) + "\n\n")
 
         current_bid = None
@@ -126,13 +148,12 @@ Commands: BID, PASS, PLAY, HAND, QUIT
         passes = 0
         bidder = 0  # Start with player
 
-        names = ["YOU", "PARTNER", "EAST", "WEST"]
-
         while passes < 4:
             if bidder == 0:
                 # Player bids
                 if current_bid:
-                    await self.output(f"CURRENT BID: {current_bid[0]} {current_bid[1]}\n")
+                    cur_level, cur_suit = current_bid
+                    await self.output(f"CURRENT BID: {cur_level} {cur_suit}\n")
                 else:
                     await self.output("CURRENT BID: NONE\n")
                 await self.output("YOUR BID (e.g., '2 HEARTS' or 'PASS'): ")
@@ -148,35 +169,34 @@ Commands: BID, PASS, PLAY, HAND, QUIT
                     cmd = cmd.replace("BID", "").strip()
                     parts = cmd.split()
                     if len(parts) >= 2:
-                        try:
-                            level = int(parts[0])
-                            suit_name = " ".join(parts[1:])
-                            suit = self.SUIT_NAMES.get(suit_name)
-
-                            if suit and 1 <= level <= 7:
-                                # Validate bid is higher
-                                valid = True
-                                if current_bid:
-                                    cur_level, cur_suit = current_bid
-                                    if level < cur_level:
+                        if not parts[0].isdecimal():
+                            await self.output("INVALID FORMAT\n")
+                            continue
+                        level = int(parts[0])
+                        suit_name = " ".join(parts[1:])
+                        suit = self.SUIT_NAMES.get(suit_name)
+
+                        if suit and 1 <= level <= 7:
+                            # Validate bid is higher
+                            valid = True
+                            if current_bid:
+                                cur_level, cur_suit = current_bid
+                                if level < cur_level:
+                                    valid = False
+                                elif level == cur_level:
+                                    if self._SUIT_RANK[suit] <= self._SUIT_RANK[cur_suit]:
                                         valid = False
-                                    elif level == cur_level:
-                                        if self.SUITS_ORDER.index(suit) <= self.SUITS_ORDER.index(cur_suit):
-                                            valid = False
-
-                                if valid:
-                                    current_bid = (level, suit)
-                                    declarer = 0
-                                    passes = 0
-                                    await self.output(f"YOU BID {level} {suit}\n")
-                                else:
-                                    await self.output("BID MUST BE HIGHER\n")
-                                    continue
+
+                            if valid:
+                                current_bid = (level, suit)
+                                declarer = 0
+                                passes = 0
+                                await self.output(f"YOU BID {level} {suit}\n")
                             else:
-                                await self.output("INVALID BID\n")
+                                await self.output("BID MUST BE HIGHER\n")
                                 continue
-                        except:
-                            await self.output("INVALID FORMAT\n")
+                        else:
+                            await self.output("INVALID BID\n")
                             continue
                 else:
                     await self.output("BID or PASS\n")
@@ -189,10 +209,11 @@ Commands: BID, PASS, PLAY, HAND, QUIT
                     current_bid = bid
                     declarer = bidder
                     passes = 0
-                    await self.output(f"{names[bidder]} BIDS {bid[0]} {bid[1]}\n")
+                    bid_level, bid_suit = bid
+                    await self.output(f"{self.SEAT_NAMES[bidder]} BIDS {bid_level} {bid_suit}\n")
                 else:
                     passes += 1
-                    await self.output(f"{names[bidder]} PASSES\n")
+                    await self.output(f"{self.SEAT_NAMES[bidder]} PASSES\n")
 
             bidder = (bidder + 1) % 4
 
@@ -202,7 +223,8 @@ Commands: BID, PASS, PLAY, HAND, QUIT
         if not current_bid:
             return None
 
-        return (current_bid[0], current_bid[1], declarer)
+        level, suit = current_bid
+        return (level, suit, declarer)
 
     async def _play_hand(self, contract: tuple[int, str, int]) -> tuple[int, int]:
         """Play the hand. Returns (NS tricks, EW tricks)."""
@@ -222,11 +244,11 @@ Commands: BID, PASS, PLAY, HAND, QUIT
                 hand = self._hands[current]
 
                 if current == 0:
-                    await self.output("YOUR HAND:\n")
-                    await self.output(f"{self._render_hand(hand)}\n")
+                    view = f"YOUR HAND:\n{self._render_hand(hand)}\n"
                     if trick:
                         trick_str = " ".join(f"[{self._card_str(c)}]" for _, c in trick)
-                        await self.output(f"TRICK: {trick_str}\n")
+                        view += f"TRICK: {trick_str}\n"
+                    await self.output(view)
 
                     while True:
                         await self.output("PLAY (card number): ")
@@ -235,56 +257,58 @@ Commands: BID, PASS, PLAY, HAND, QUIT
                         if cmd.upper() in {"QUIT", "Q"}:
                             raise PlayerQuit()
 
-                        try:
+                        if cmd.isdecimal():
                             pos = int(cmd) - 1
                             if 0 <= pos < len(hand):
                                 card = hand[pos]
                                 # Check if must follow suit
                                 if lead_suit:
-                                    same_suit = [c for c in hand if c[1] == lead_suit]
-                                    if same_suit and card[1] != lead_suit:
+                                    if self._by_suit[0][lead_suit] and card[1] != lead_suit:
                                         await self.output("MUST FOLLOW SUIT\n")
                                         continue
 
-                                hand.remove(card)
+                                self._play_card(current, pos)
                                 trick.append((current, card))
                                 if not lead_suit:
                                     lead_suit = card[1]
                                 await self.output(f"YOU PLAY [{self._card_str(card)}]\n")
                                 break
-                        except:
-                            pass
                         await self.output("INVALID\n")
 
                 else:
                     # WOPR plays
-                    valid = [c for c in hand if c[1] == lead_suit] if lead_suit else hand
-                    if not valid:
-                        valid = hand
-
                     # Simple: play highest if winning, lowest otherwise
-                    card = max(valid, key=self._card_value) if len(trick) == 3 else min(valid, key=self._card_value)
-                    hand.remove(card)
+                    following = self._by_suit[current][lead_suit] if lead_suit else None
+                    if following:
+                        pos = self._suit_offset(current, lead_suit)
+                        if len(trick) == 3:
+                            pos += len(following) - 1
+                    else:
+                        choose = max if len(trick) == 3 else min
+                        pos = choose(range(len(hand)), key=lambda i: self._card_value(hand[i]))
+                    card = self._play_card(current, pos)
                     trick.append((current, card))
                     if not lead_suit:
                         lead_suit = card[1]
 
-                    name = ["YOU", "PARTNER", "EAST", "WEST"][current]
+                    name = self.SEAT_NAMES[current]
                     await self.output(f"{name} PLAYS [{self._card_str(card)}]\n")
 
-            # Determine winner
-            winning_card = trick[0]
-            for player, card in trick[1:]:
-                if card[1] == trump and winning_card[1][1] != trump:
-                    winning_card = (player, card)
-                elif card[1] == winning_card[1][1] and self._card_value(card) > self._card_value(winning_card[1]):
-                    winning_card = (player, card)
-
-            winner = winning_card[0]
+            # Determine winner: highest trump, else highest card of the led suit
+            def trick_key(played: tuple[int, tuple[str, str]]) -> tuple[int, int]:
+                _, card = played
+                rank, suit = card
+                if suit == trump:
+                    return (2, self._RANK_ORDER[rank])
+                if suit == lead_suit:
+                    return (1, self._RANK_ORDER[rank])
+                return (0, 0)
+
+            winner, _ = max(trick, key=trick_key)
             team = 0 if winner in [0, 1] else 1
             tricks[team] += 1
 
-            name = ["YOU", "PARTNER", "EAST", "WEST"][winner]
+            name = self.SEAT_NAMES[winner]
             await self.output(f"{name} WINS TRICK (NS: {tricks[0]}, EW: {tricks[1]})\n")
             leader = winner
 
@@ -1,11 +1,116 @@
 """Gin Rummy card game."""
 
 from typing import Any
+from bisect import insort
+from functools import lru_cache
 import random
-from collections import defaultdict
 
 from ..base import CardGame, GameResult
 
+# Card bit layout for meld finding: bit (suit * 13 + rank index), aces low
+_RANKS = ("A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K")
+_SUIT_SHIFT = {suit: i * 13 for i, suit in enumerate(CardGame.SUITS)}
+_CARD_BIT = {
+    (rank, suit): 1 << (shift + i)
+    for suit, shift in _SUIT_SHIFT.items()
+    for i, rank in enumerate(_RANKS)
+}
+_RANK_MASK = {
+    rank: sum(1 << (shift + i) for shift in _SUIT_SHIFT.values())
+    for i, rank in enumerate(_RANKS)
+}
+_SUIT_BITS = 0x1FFF  # one suit's 13 ranks
+_RANK_INDEX = {rank: i for i, rank in enumerate(_RANKS)}
+# Face cards = 10 points, Aces = 1, others = face value
+_POINTS = {rank: min(i + 1, 10) for i, rank in enumerate(_RANKS)}
+_BIT_CARD = {bit: card for card, bit in _CARD_BIT.items()}
+_BIT_POINTS = {bit: _POINTS[card[0]] for card, bit in _CARD_BIT.items()}
+# Display order (suit, then rank) flattened to one int per card
+_SORT_KEY = {
+    card: i
+    for i, card in enumerate(sorted(_CARD_BIT, key=lambda c: (c[1], _RANK_INDEX[c[0]])))
+}
+
+
+def _run_blocks(bits: int) -> tuple[int, ...]:
+    """Split one suit's 13-bit rank pattern into its runs of 3+ consecutive ranks."""
+    starts = bits & (bits >> 1) & (bits >> 2)
+    in_run = starts | (starts << 1) | (starts << 2)
+    blocks = []
+    while in_run:
+        # Peel off the lowest block of consecutive ranks
+        low = in_run & -in_run
+        block = in_run & ~(in_run + low)
+        blocks.append(block)
+        in_run ^= block
+    return tuple(blocks)
+
+
+# Runs for every possible suit pattern, so meld finding is a table lookup per suit
+_RUNS_BY_PATTERN = tuple(_run_blocks(bits) for bits in range(_SUIT_BITS + 1))
+
+
+@lru_cache(maxsize=8192)
+def _meld_masks(mask: int) -> tuple[tuple[int, ...], int]:
+    """Find melds in a hand mask. Returns (one mask per meld, all melded cards)."""
+    melds = []
+    used = 0
+
+    # Find sets (3-4 of same rank)
+    for rank_mask in _RANK_MASK.values():
+        column = mask & rank_mask
+        if column.bit_count() >= 3:
+            melds.append(column)
+            used |= column
+
+    # Find runs (3+ consecutive same suit) among the remaining cards
+    for shift in _SUIT_SHIFT.values():
+        for block in _RUNS_BY_PATTERN[((mask & ~used) >> shift) & _SUIT_BITS]:
+            melds.append(block << shift)
+            used |= block << shift
+
+    return tuple(melds), used
+
+
+def _hand_mask(hand: list[tuple[str, str]]) -> int:
+    """Fold a hand into its 52-bit card mask."""
+    mask = 0
+    for card in hand:
+        mask |= _CARD_BIT[card]
+    return mask
+
+
+def _deadwood_points(mask: int) -> int:
+    """Total points of the unmelded cards in a hand mask."""
+    rest = mask & ~_meld_masks(mask)[1]
+    total = 0
+    while rest:
+        low = rest & -rest
+        total += _BIT_POINTS[low]
+        rest ^= low
+    return total
+
+
+def _best_discard(mask: int, keep: int = 0) -> tuple[int, int]:
+    """Pick the discard leaving the least deadwood, ties going to the higher card.
+
+    Returns (card bit, deadwood points after discarding it). Dropping an
+    unmelded card cannot change the melds, so only meld cards need a fresh
+    search; cards in ``keep`` are never discarded.
+    """
+    used = _meld_masks(mask)[1]
+    deadwood = _deadwood_points(mask)
+    best_bit, best_after, best_points = 0, None, 0
+    candidates = mask & ~keep
+    while candidates:
+        bit = candidates & -candidates
+        candidates ^= bit
+        points = _BIT_POINTS[bit]
+        after = _deadwood_points(mask ^ bit) if bit & used else deadwood - points
+        if best_after is None or after < best_after or (after == best_after and points > best_points):
+            best_bit, best_after, best_points = bit, after, points
+    return best_bit, best_after
+
 
 class GinRummy(CardGame):
     """Gin Rummy against WOPR."""
@@ -41,122 +146,73 @@ Face cards = 10 points, Aces = 1, others = face value
 
     def _card_points(self, card: tuple[str, str]) -> int:
         """Get point value of a card."""
-        rank = card[0]
-        if rank in ["J", "Q", "K"]:
-            return 10
-        elif rank == "A":
-            return 1
-        else:
-            return int(rank)
+        return _POINTS[card[0]]
 
     def _rank_index(self, rank: str) -> int:
         """Get numeric index of a rank for run checking."""
-        order = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
-        return order.index(rank)
+        return _RANK_INDEX[rank]
 
     def _find_melds(self, hand: list[tuple[str, str]]) -> tuple[list[list[tuple[str, str]]], list[tuple[str, str]]]:
-        """Find all valid melds in a hand. Returns (melds, deadwood)."""
+        """Find all valid melds in a hand. Returns (melds, deadwood).
+
+        The hand is folded into a 52-bit mask so sets and runs fall out of
+        a few bitwise operations per rank and suit; results are cached per mask.
+        """
         if not hand:
             return [], []
 
-        # Group by rank and suit
-        by_rank = defaultdict(list)
-        by_suit = defaultdict(list)
-        for card in hand:
-            by_rank[card[0]].append(card)
-            by_suit[card[1]].append(card)
-
-        melds = []
-        used = set()
-
-        # Find sets (3-4 of same rank)
-        for rank, cards in by_rank.items():
-            if len(cards) >= 3:
-                meld = cards[:min(4, len(cards))]
-                melds.append(meld)
-                for card in meld:
-                    used.add(card)
-
-        # Find runs (3+ consecutive same suit)
-        for suit, cards in by_suit.items():
-            available = [c for c in cards if c not in used]
-            available.sort(key=lambda c: self._rank_index(c[0]))
-
-            i = 0
-            while i < len(available):
-                run = [available[i]]
-                j = i + 1
-                while j < len(available):
-                    if self._rank_index(available[j][0]) == self._rank_index(run[-1][0]) + 1:
-                        run.append(available[j])
-                        j += 1
-                    else:
-                        break
-
-                if len(run) >= 3:
-                    melds.append(run)
-                    for card in run:
-                        used.add(card)
-                    i = j
-                else:
-                    i += 1
+        meld_masks, used = _meld_masks(_hand_mask(hand))
 
-        deadwood = [c for c in hand if c not in used]
+        melds = [[c for c in hand if _CARD_BIT[c] & meld] for meld in meld_masks]
+        deadwood = [c for c in hand if not _CARD_BIT[c] & used]
         return melds, deadwood
 
     def _deadwood_value(self, hand: list[tuple[str, str]]) -> int:
         """Calculate total deadwood points."""
-        _, deadwood = self._find_melds(hand)
-        return sum(self._card_points(c) for c in deadwood)
+        return _deadwood_points(_hand_mask(hand))
 
     def _render_hand(self, hand: list[tuple[str, str]], numbered: bool = True) -> str:
-        """Render hand with position numbers using larger ASCII art."""
-        sorted_hand = sorted(hand, key=lambda c: (c[1], self._rank_index(c[0])))
-        return self._render_hand_art(sorted_hand, numbered=numbered)
+        """Render an already sorted hand with position numbers using larger ASCII art."""
+        return self._render_hand_art(hand, numbered=numbered)
 
     def _deal_hands(self) -> None:
         """Deal 10 cards to each player."""
         self._shuffle_deck()
-        self._player_hand = [self._draw_card() for _ in range(10)]
-        self._wopr_hand = [self._draw_card() for _ in range(10)]
-        self._discard_pile = [self._draw_card()]
+        # Deal from the top of the deck, the end _draw_card pops from
+        deck = self._deck
+        # The player's hand is kept in display order from here on
+        self._player_hand = sorted(deck[-10:], key=_SORT_KEY.__getitem__)
+        self._wopr_hand = deck[-20:-10]
+        self._discard_pile = [deck[-21]]
+        del deck[-21:]
 
     def _wopr_turn(self) -> bool:
         """Execute WOPR's turn. Returns True if WOPR knocks/gins."""
-        # Decide whether to take discard
-        discard_top = self._discard_pile[-1] if self._discard_pile else None
-
-        # Simple AI: take discard if it helps
-        take_discard = False
-        if discard_top:
-            test_hand = self._wopr_hand + [discard_top]
-            current_deadwood = self._deadwood_value(self._wopr_hand)
-            # Estimate improvement
-            _, new_deadwood = self._find_melds(test_hand)
-            if len(new_deadwood) < len(self._find_melds(self._wopr_hand)[1]):
-                take_discard = True
-
-        if take_discard and self._discard_pile:
+        hand_mask = _hand_mask(self._wopr_hand)
+        keep = 0
+
+        # Take the discard if the best discard afterwards beats the current deadwood
+        if self._discard_pile:
+            top_bit = _CARD_BIT[self._discard_pile[-1]]
+            _, after = _best_discard(hand_mask | top_bit, keep=top_bit)
+            if after < _deadwood_points(hand_mask):
+                keep = top_bit
+
+        if keep:
             self._wopr_hand.append(self._discard_pile.pop())
         else:
             card = self._draw_card()
             if card:
                 self._wopr_hand.append(card)
+                hand_mask |= _CARD_BIT[card]
 
-        # Find worst card to discard
-        _, deadwood = self._find_melds(self._wopr_hand)
-        if deadwood:
-            # Discard highest deadwood
-            worst = max(deadwood, key=self._card_points)
-        else:
-            # Gin! But discard anyway for now
-            worst = max(self._wopr_hand, key=self._card_points)
-
+        # Discard whichever card leaves the least deadwood
+        worst_bit, deadwood_value = _best_discard(hand_mask | keep, keep=keep)
+        worst = _BIT_CARD[worst_bit]
         self._wopr_hand.remove(worst)
         self._discard_pile.append(worst)
 
         # Check for knock/gin
-        deadwood_value = self._deadwood_value(self._wopr_hand)
         if deadwood_value == 0:
             return True  # Gin
         elif deadwood_value <= 10:
@@ -170,21 +226,23 @@ Face cards = 10 points, Aces = 1, others = face value
 
         while self._player_score < self._target_score and self._wopr_score < self._target_score:
             self._deal_hands()
-            await self.output(f"\nSCORE - YOU: {self._player_score}  WOPR: {self._wopr_score}\n")
-            await self.output(f"TARGET: {self._target_score}\n\n")
+            await self.output(
+                f"\nSCORE - YOU: {self._player_score}  WOPR: {self._wopr_score}\n"
+                f"TARGET: {self._target_score}\n\n"
+            )
 
             game_over = False
             player_turn = True
 
             while not game_over and len(self._deck) > 2:
                 if player_turn:
-                    # Show state
-                    await self.output(f"\nDISCARD: [{self._card_str(self._discard_pile[-1])}]\n")
-                    await self.output(f"YOUR HAND ({self._deadwood_value(self._player_hand)} deadwood):\n")
-                    await self.output(self._render_hand(self._player_hand) + "\n")
-
-                    # Get command
-                    await self.output("\nCOMMAND: ")
+                    # Show state and prompt in one write
+                    await self.output(
+                        f"\nDISCARD: [{self._card_str(self._discard_pile[-1])}]\n"
+                        f"YOUR HAND ({self._deadwood_value(self._player_hand)} deadwood):\n"
+                        f"{self._render_hand(self._player_hand)}\n"
+                        "\nCOMMAND: "
+                    )
                     cmd = (await self._input()).strip().upper()
 
                     if cmd in {"QUIT", "Q"}:
@@ -192,36 +250,34 @@ Face cards = 10 points, Aces = 1, others = face value
 
                     elif cmd == "HAND":
                         melds, deadwood = self._find_melds(self._player_hand)
-                        await self.output("MELDS:\n")
+                        msg = ["MELDS:\n"]
                         for meld in melds:
-                            await self.output(f"  {self._render_hand(meld, False)}\n")
-                        await self.output("DEADWOOD:\n")
-                        await self.output(f"{self._render_hand(deadwood, False)}\n")
+                            msg.append(f"  {self._render_hand(meld, False)}\n")
+                        msg.append(f"DEADWOOD:\n{self._render_hand(deadwood, False)}\n")
+                        await self.output("".join(msg))
                         continue
 
                     elif cmd == "DRAW DECK":
                         card = self._draw_card()
                         if card:
-                            self._player_hand.append(card)
+                            insort(self._player_hand, card, key=_SORT_KEY.__getitem__)
                             await self.output(f"DREW: [{self._card_str(card)}]\n")
 
                     elif cmd == "DRAW DISCARD":
                         if self._discard_pile:
                             card = self._discard_pile.pop()
-                            self._player_hand.append(card)
+                            insort(self._player_hand, card, key=_SORT_KEY.__getitem__)
                             await self.output(f"TOOK: [{self._card_str(card)}]\n")
 
                     elif cmd.startswith("DISCARD"):
                         try:
                             pos = int(cmd.split()[-1]) - 1
-                            sorted_hand = sorted(self._player_hand, key=lambda c: (c[1], self._rank_index(c[0])))
-                            if 0 <= pos < len(sorted_hand):
-                                card = sorted_hand[pos]
-                                self._player_hand.remove(card)
+                            if 0 <= pos < len(self._player_hand):
+                                card = self._player_hand.pop(pos)
                                 self._discard_pile.append(card)
                                 await self.output(f"DISCARDED: [{self._card_str(card)}]\n")
                                 player_turn = False
-                        except:
+                        except (ValueError, IndexError):
                             await self.output("INVALID DISCARD\n")
 
                     elif cmd in {"KNOCK", "GIN"}:
@@ -233,28 +289,30 @@ Face cards = 10 points, Aces = 1, others = face value
                         else:
                             game_over = True
                             wopr_deadwood = self._deadwood_value(self._wopr_hand)
-                            await self.output(f"\nYOU {'GIN' if deadwood == 0 else 'KNOCK'} WITH {deadwood}\n")
-                            await self.output(f"WOPR HAS {wopr_deadwood} DEADWOOD\n")
+                            summary = (
+                                f"\nYOU {'GIN' if deadwood == 0 else 'KNOCK'} WITH {deadwood}\n"
+                                f"WOPR HAS {wopr_deadwood} DEADWOOD\n"
+                            )
 
                             if deadwood == 0:
                                 points = wopr_deadwood + 25
                                 self._player_score += points
-                                await self.output(f"GIN! YOU SCORE {points}\n")
+                                await self.output(f"{summary}GIN! YOU SCORE {points}\n")
                             elif wopr_deadwood < deadwood:
                                 points = deadwood - wopr_deadwood + 25
                                 self._wopr_score += points
-                                await self.output(f"UNDERCUT! WOPR SCORES {points}\n")
+                                await self.output(f"{summary}UNDERCUT! WOPR SCORES {points}\n")
                             else:
                                 points = wopr_deadwood - deadwood
                                 self._player_score += points
-                                await self.output(f"YOU SCORE {points}\n")
+                                await self.output(f"{summary}YOU SCORE {points}\n")
 
                     else:
                         await self.output("INVALID COMMAND\n")
 
                 else:
                     # WOPR's turn
-                    await self.output("\nWOPR'S TURN...\n")
+                    turn = "\nWOPR'S TURN...\n"
                     knocked = self._wopr_turn()
 
                     if knocked:
@@ -265,17 +323,17 @@ Face cards = 10 points, Aces = 1, others = face value
                         if wopr_deadwood == 0:
                             points = player_deadwood + 25
                             self._wopr_score += points
-                            await self.output(f"WOPR GINS! SCORES {points}\n")
+                            await self.output(f"{turn}WOPR GINS! SCORES {points}\n")
                         elif player_deadwood < wopr_deadwood:
                             points = wopr_deadwood - player_deadwood + 25
                             self._player_score += points
-                            await self.output(f"YOU UNDERCUT! SCORE {points}\n")
+                            await self.output(f"{turn}YOU UNDERCUT! SCORE {points}\n")
                         else:
                             points = player_deadwood - wopr_deadwood
                             self._wopr_score += points
-                            await self.output(f"WOPR KNOCKS AND SCORES {points}\n")
+                            await self.output(f"{turn}WOPR KNOCKS AND SCORES {points}\n")
                     else:
-                        await self.output(f"WOPR DISCARDS [{self._card_str(self._discard_pile[-1])}]\n")
+                        await self.output(f"{turn}WOPR DISCARDS [{self._card_str(self._discard_pile[-1])}]\n")
                         player_turn = True
 
             if not game_over:
@@ -3,13 +3,9 @@
 from typing import Any
 import random
 from collections import defaultdict
+from itertools import product
 
-from ..base import CardGame, GameResult
-
-
-class PlayerQuit(Exception):
-    """Raised when player wants to quit the game."""
-    pass
+from ..base import CardGame, GameResult, PlayerQuit
 
 
 class Hearts(CardGame):
@@ -37,82 +33,118 @@ Commands:
   QUIT    - Leave game
 """
 
+    SEAT_NAMES = ("YOU", "WOPR-A", "WOPR-B", "WOPR-C")
+    _RANK_ORDER = {
+        rank: i
+        for i, rank in enumerate(["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"])
+    }
+    _SUIT_ORDER = {"♣": 0, "♦": 1, "♠": 2, "♥": 3}
+    # Sort position of every card: suit, then rank
+    _SORT_KEY = {
+        (rank, suit): i
+        for i, (suit, rank) in enumerate(product(_SUIT_ORDER, _RANK_ORDER))
+    }
+    _TWO_OF_CLUBS = ("2", "♣")
+    # Hearts score 1 each, the Queen of Spades 13
+    _POINTS = {
+        card: 1 if card[1] == "♥" else 13 if card == ("Q", "♠") else 0
+        for card in CardGame.FULL_DECK
+    }
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self._hands: dict[int, list[tuple[str, str]]] = {}  # 0=player, 1-3=WOPR
+        self._hands: list[list[tuple[str, str]]] = [[], [], [], []]  # 0=player, 1-3=WOPR
+        self._by_suit: list[dict[str, list[tuple[str, str]]]] = []  # per-player cards by suit
         self._scores = [0, 0, 0, 0]
         self._trick: list[tuple[int, tuple[str, str]]] = []
         self._hearts_broken = False
         self._hand_number = 0
+        self._hand_art: str | None = None  # player's rendered hand, until it changes
 
     def _card_value(self, card: tuple[str, str]) -> int:
         """Get numeric value for ordering."""
-        ranks = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
-        return ranks.index(card[0])
+        return self._RANK_ORDER[card[0]]
 
     def _suit_order(self, suit: str) -> int:
         """Get suit order for sorting."""
-        return ["♣", "♦", "♠", "♥"].index(suit)
+        return self._SUIT_ORDER[suit]
 
     def _sort_hand(self, hand: list[tuple[str, str]]) -> list[tuple[str, str]]:
         """Sort hand by suit then rank."""
-        return sorted(hand, key=lambda c: (self._suit_order(c[1]), self._card_value(c)))
+        return sorted(hand, key=self._SORT_KEY.__getitem__)
 
     def _deal_hands(self) -> None:
         """Deal 13 cards to each player."""
         self._shuffle_deck()
-        for i in range(4):
-            self._hands[i] = [self._draw_card() for _ in range(13)]
-            self._hands[i] = self._sort_hand(self._hands[i])
+        # Deal from the top of the deck, the end _draw_card pops from
+        deck = self._deck[::-1]
+        self._deck.clear()
+        self._hands = [self._sort_hand(deck[i * 13:(i + 1) * 13]) for i in range(4)]
+        self._by_suit = [
+            {suit: [c for c in hand if c[1] == suit] for suit in self._SUIT_ORDER}
+            for hand in self._hands
+        ]
+        self._hand_art = None
         self._hearts_broken = False
 
+    def _play_card(self, player: int, pos: int) -> tuple[str, str]:
+        """Remove and return the card at ``pos`` in a player's hand."""
+        card = self._hands[player].pop(pos)
+        self._by_suit[player][card[1]].remove(card)
+        if player == 0:
+            self._hand_art = None
+        return card
+
     def _card_points(self, card: tuple[str, str]) -> int:
         """Get point value of a card."""
-        if card[1] == "♥":
-            return 1
-        if card == ("Q", "♠"):
-            return 13
-        return 0
+        return self._POINTS[card]
 
     def _trick_points(self, trick: list[tuple[int, tuple[str, str]]]) -> int:
         """Calculate points in a trick."""
-        return sum(self._card_points(card) for _, card in trick)
+        card_points = self._POINTS
+        return sum(card_points[card] for _, card in trick)
 
     def _trick_winner(self, trick: list[tuple[int, tuple[str, str]]]) -> int:
         """Determine who won the trick."""
         lead_suit = trick[0][1][1]
-        winner = trick[0]
-        for player, card in trick[1:]:
-            if card[1] == lead_suit and self._card_value(card) > self._card_value(winner[1]):
-                winner = (player, card)
-        return winner[0]
+        rank_order = self._RANK_ORDER
+        # Off-suit cards rank below every card of the lead suit
+        return max(
+            trick,
+            key=lambda play: rank_order[play[1][0]] if play[1][1] == lead_suit else -1,
+        )[0]
+
+    def _has_two_of_clubs(self, player: int) -> bool:
+        """Check the lowest club, the only place the 2 of clubs can be."""
+        clubs = self._by_suit[player]["♣"]
+        return bool(clubs) and clubs[0] == self._TWO_OF_CLUBS
 
     def _valid_plays(self, player: int, lead_suit: str | None) -> list[tuple[str, str]]:
         """Get valid cards to play."""
         hand = self._hands[player]
+        by_suit = self._by_suit[player]
 
         # First trick - 2 of clubs must lead
         if not self._trick and not lead_suit:
-            if ("2", "♣") in hand:
-                return [("2", "♣")]
+            if self._has_two_of_clubs(player):
+                return [self._TWO_OF_CLUBS]
 
         # Must follow suit if possible
         if lead_suit:
-            same_suit = [c for c in hand if c[1] == lead_suit]
+            same_suit = by_suit[lead_suit]
             if same_suit:
                 return same_suit
 
         # First trick - can't play hearts or Q of spades
         if len(self._trick) < 4 and not lead_suit:
-            non_points = [c for c in hand if self._card_points(c) == 0]
+            non_points = by_suit["♣"] + by_suit["♦"] + [c for c in by_suit["♠"] if c[0] != "Q"]
             if non_points:
                 return non_points
 
         # Leading - can't lead hearts until broken
         if not lead_suit and not self._hearts_broken:
-            non_hearts = [c for c in hand if c[1] != "♥"]
-            if non_hearts:
-                return non_hearts
+            if len(hand) > len(by_suit["♥"]):
+                return by_suit["♣"] + by_suit["♦"] + by_suit["♠"]
 
         return hand  # Any card
 
@@ -122,10 +154,10 @@ Commands:
 
         # Simple strategy: avoid taking points
         if lead_suit:
-            # Try to play low card of suit
-            same_suit = [c for c in valid if c[1] == lead_suit]
+            # Try to play low card of suit; the suit's cards are kept sorted
+            same_suit = self._by_suit[player][lead_suit]
             if same_suit:
-                return min(same_suit, key=self._card_value)
+                return same_suit[0]
             # Dump high point cards
             point_cards = [c for c in valid if self._card_points(c) > 0]
             if point_cards:
@@ -140,9 +172,14 @@ Commands:
             return min(valid, key=self._card_value)
 
     def _render_hand(self, hand: list[tuple[str, str]]) -> str:
-        """Render hand with position numbers using larger ASCII art."""
-        sorted_hand = self._sort_hand(hand)
-        return self._render_hand_art(sorted_hand, numbered=True)
+        """Render an already sorted hand with position numbers using larger ASCII art."""
+        return self._render_hand_art(hand, numbered=True)
+
+    def _player_hand_art(self) -> str:
+        """Render the player's hand, reusing the last render while it is unchanged."""
+        if self._hand_art is None:
+            self._hand_art = self._render_hand(self._hands[0])
+        return self._hand_art
 
     async def _play_hand(self) -> list[int]:
         """Play one hand. Returns points taken by each player."""
@@ -152,7 +189,7 @@ Commands:
 
         # Find who has 2 of clubs
         for i in range(4):
-            if ("2", "♣") in self._hands[i]:
+            if self._has_two_of_clubs(i):
                 leader = i
                 break
 
@@ -160,20 +197,23 @@ Commands:
             self._trick = []
             lead_suit = None
 
-            await self.output(f"\n=== TRICK {trick_num + 1} ===\n")
+            # Trick narration is buffered and written once per prompt or trick
+            msg = [f"\n=== TRICK {trick_num + 1} ===\n"]
 
             for i in range(4):
                 current = (leader + i) % 4
 
                 if current == 0:
                     # Player's turn
-                    await self.output(f"\nYOUR HAND:\n{self._render_hand(self._hands[0])}\n")
+                    msg.append(f"\nYOUR HAND:\n{self._player_hand_art()}\n")
                     if self._trick:
                         trick_str = " ".join(f"[{self._card_str(c)}]" for _, c in self._trick)
-                        await self.output(f"CURRENT TRICK: {trick_str}\n")
+                        msg.append(f"CURRENT TRICK: {trick_str}\n")
+                    await self.output("".join(msg))
+                    msg = []
 
                     valid = self._valid_plays(0, lead_suit)
-                    sorted_hand = self._sort_hand(self._hands[0])
+                    sorted_hand = self._hands[0]  # kept sorted since the deal
 
                     while True:
                         await self.output("PLAY (card number): ")
@@ -183,14 +223,14 @@ Commands:
                             raise PlayerQuit()
 
                         if cmd == "HAND":
-                            await self.output(f"{self._render_hand(self._hands[0])}\n")
+                            await self.output(f"{self._player_hand_art()}\n")
                             continue
 
                         if cmd == "SCORE":
-                            await self.output(f"SCORES: YOU={self._scores[0]} ")
-                            await self.output(f"WOPR-A={self._scores[1]} ")
-                            await self.output(f"WOPR-B={self._scores[2]} ")
-                            await self.output(f"WOPR-C={self._scores[3]}\n")
+                            await self.output(
+                                f"SCORES: YOU={self._scores[0]} WOPR-A={self._scores[1]} "
+                                f"WOPR-B={self._scores[2]} WOPR-C={self._scores[3]}\n"
+                            )
                             continue
 
                         try:
@@ -198,40 +238,39 @@ Commands:
                             if 0 <= pos < len(sorted_hand):
                                 card = sorted_hand[pos]
                                 if card in valid:
-                                    self._hands[0].remove(card)
+                                    self._play_card(0, pos)
                                     self._trick.append((0, card))
                                     if not lead_suit:
                                         lead_suit = card[1]
                                     if card[1] == "♥":
                                         self._hearts_broken = True
-                                    await self.output(f"YOU PLAY: [{self._card_str(card)}]\n")
+                                    msg.append(f"YOU PLAY: [{self._card_str(card)}]\n")
                                     break
                                 else:
                                     await self.output("INVALID PLAY\n")
                             else:
                                 await self.output("INVALID CARD NUMBER\n")
-                        except:
+                        except (ValueError, IndexError):
                             await self.output("ENTER CARD NUMBER\n")
 
                 else:
                     # WOPR's turn
                     card = self._wopr_play(current, lead_suit)
-                    self._hands[current].remove(card)
+                    self._play_card(current, self._hands[current].index(card))
                     self._trick.append((current, card))
                     if not lead_suit:
                         lead_suit = card[1]
                     if card[1] == "♥":
                         self._hearts_broken = True
-                    name = ["YOU", "WOPR-A", "WOPR-B", "WOPR-C"][current]
-                    await self.output(f"{name} PLAYS: [{self._card_str(card)}]\n")
+                    msg.append(f"{self.SEAT_NAMES[current]} PLAYS: [{self._card_str(card)}]\n")
 
             # Determine winner
             winner = self._trick_winner(self._trick)
             trick_pts = self._trick_points(self._trick)
             points[winner] += trick_pts
 
-            name = ["YOU", "WOPR-A", "WOPR-B", "WOPR-C"][winner]
-            await self.output(f"\n{name} TAKES TRICK ({trick_pts} points)\n")
+            msg.append(f"\n{self.SEAT_NAMES[winner]} TAKES TRICK ({trick_pts} points)\n")
+            await self.output("".join(msg))
             leader = winner
 
         return points
@@ -242,39 +281,44 @@ Commands:
 
         try:
             while max(self._scores) < 100:
-                await self.output(f"\n{'='*40}\n")
-                await self.output(f"HAND {self._hand_number + 1}\n")
-                await self.output(f"SCORES: YOU={self._scores[0]} WOPR-A={self._scores[1]} ")
-                await self.output(f"WOPR-B={self._scores[2]} WOPR-C={self._scores[3]}\n")
+                await self.output(
+                    f"\n{'='*40}\n"
+                    f"HAND {self._hand_number + 1}\n"
+                    f"SCORES: YOU={self._scores[0]} WOPR-A={self._scores[1]} "
+                    f"WOPR-B={self._scores[2]} WOPR-C={self._scores[3]}\n"
+                )
 
                 points = await self._play_hand()
 
                 # Check for shoot the moon
-                for i in range(4):
-                    if points[i] == 26:
-                        await self.output(f"\n{'['*3} SHOT THE MOON! {']'*3}\n")
-                        for j in range(4):
-                            if j != i:
-                                self._scores[j] += 26
-                        points = [0, 0, 0, 0]
-                        break
+                if 26 in points:
+                    shooter = points.index(26)
+                    await self.output(f"\n{'['*3} SHOT THE MOON! {']'*3}\n")
+                    for j in range(4):
+                        if j != shooter:
+                            self._scores[j] += 26
+                    points = [0, 0, 0, 0]
 
                 for i in range(4):
                     self._scores[i] += points[i]
 
                 self._hand_number += 1
 
-                await self.output(f"\nHAND COMPLETE. POINTS THIS HAND:\n")
-                await self.output(f"YOU: {points[0]}  WOPR-A: {points[1]}  ")
-                await self.output(f"WOPR-B: {points[2]}  WOPR-C: {points[3]}\n")
+                await self.output(
+                    "\nHAND COMPLETE. POINTS THIS HAND:\n"
+                    f"YOU: {points[0]}  WOPR-A: {points[1]}  "
+                    f"WOPR-B: {points[2]}  WOPR-C: {points[3]}\n"
+                )
 
         except PlayerQuit:
             pass
 
         # Determine winner
-        await self.output(f"\nFINAL SCORES:\n")
-        await self.output(f"YOU: {self._scores[0]}  WOPR-A: {self._scores[1]}  ")
-        await self.output(f"WOPR-B: {self._scores[2]}  WOPR-C: {self._scores[3]}\n")
+        await self.output(
+            "\nFINAL SCORES:\n"
+            f"YOU: {self._scores[0]}  WOPR-A: {self._scores[1]}  "
+            f"WOPR-B: {self._scores[2]}  WOPR-C: {self._scores[3]}\n"
+        )
 
         if self._scores[0] == min(self._scores):
             await self.output("YOU WIN!\n")
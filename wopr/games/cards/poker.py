@@ -2,10 +2,84 @@
 
 from typing import Any
 import random
-from collections import Counter
+import re
+from itertools import combinations_with_replacement
 
 from ..base import CardGame, GameResult
 
+# One prime per rank value (2-14, aces high) so a paired hand's product is unique
+_RANK_PRIMES = dict(zip(range(2, 15), (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)))
+_CARD_RANKS = {"A": 14, "K": 13, "Q": 12, "J": 11, **{str(v): v for v in range(2, 11)}}
+_SUIT_BITS = {"♠": 0x1000, "♥": 0x2000, "♦": 0x4000, "♣": 0x8000}
+
+# Cactus Kev style card ints: rank bit (bits 16-28) | suit bit (12-15) | rank prime (0-7)
+_CARD_INT = {
+    (rank, suit): (1 << (14 + value)) | suit_bit | _RANK_PRIMES[value]
+    for rank, value in _CARD_RANKS.items()
+    for suit, suit_bit in _SUIT_BITS.items()
+}
+
+# (category, tiebreaker ranks); compares the way poker hands rank
+_HandValue = tuple[int, tuple[int, ...]]
+
+# Hand category by rank-count shape, for hands with a repeated rank
+_PAIRED_CATEGORIES = {(4, 1): 7, (3, 2): 6, (3, 1, 1): 3, (2, 2, 1): 2, (2, 1, 1, 1): 1}
+
+# High card of each straight, keyed by its 13-bit rank mask (bit 0 = deuce);
+# the wheel (A-2-3-4-5) plays as a five-high straight
+_STRAIGHT_HIGH = {0b11111 << (high - 6): high for high in range(6, 15)}
+_STRAIGHT_HIGH[0b1000000001111] = 5
+
+
+def _build_lookups() -> tuple[dict[int, _HandValue], dict[int, _HandValue]]:
+    """Evaluate every 5-card rank pattern once.
+
+    Returns (flush lookup keyed by the 13-bit rank OR, lookup for all other
+    hands keyed by the product of rank primes); both map to
+    (category, tiebreaker ranks).
+    """
+    flush_lookup = {}
+    unsuited_lookup = {}
+    for values in combinations_with_replacement(range(14, 1, -1), 5):
+        # One pass gathers rank counts, the prime product and the rank mask
+        counts = [0] * 15
+        key = 1
+        bits = 0
+        for v in values:
+            counts[v] += 1
+            key *= _RANK_PRIMES[v]
+            bits |= 1 << (v - 2)
+        if bits.bit_count() < 5:
+            # A rank repeats: category comes from the group sizes
+            shape = tuple(sorted((n for n in counts if n), reverse=True))
+            if shape[0] > 4:
+                continue
+            # Larger groups first, then higher ranks
+            ranks = tuple(sorted(values, key=lambda v: (counts[v], v), reverse=True))
+            unsuited_lookup[key] = (_PAIRED_CATEGORIES[shape], ranks)
+            continue
+
+        high = _STRAIGHT_HIGH.get(bits)
+        if high:
+            ranks = tuple(range(high, high - 5, -1))  # Ace-low straight ends at 1
+            unsuited_lookup[key] = (4, ranks)  # Straight
+            flush_lookup[bits] = (9 if high == 14 else 8, ranks)  # Royal / straight flush
+        else:
+            ranks = values
+            unsuited_lookup[key] = (0, ranks)  # High card
+            flush_lookup[bits] = (5, ranks)  # Flush
+    return flush_lookup, unsuited_lookup
+
+
+_FLUSH_LOOKUP, _UNSUITED_LOOKUP = _build_lookups()
+
+# Discard-phase command; an empty line keeps every card
+_CMD_RE = re.compile(
+    r"^\s*(?:(?P<fold>FOLD|F)|(?P<quit>QUIT|Q)|(?P<keep>KEEP|K)"
+    r"|(?:DISCARD\s*)?(?P<discard>\d[\d,\s]*))?\s*$",
+    re.IGNORECASE,
+)
+
 
 class Poker(CardGame):
     """Five-card draw poker against WOPR."""
@@ -53,58 +127,18 @@ Commands:
 
     def _rank_value(self, rank: str) -> int:
         """Get numeric value of a rank."""
-        if rank == "A":
-            return 14
-        elif rank == "K":
-            return 13
-        elif rank == "Q":
-            return 12
-        elif rank == "J":
-            return 11
-        else:
-            return int(rank)
-
-    def _evaluate_hand(self, hand: list[tuple[str, str]]) -> tuple[int, list[int]]:
-        """Evaluate a poker hand. Returns (rank_index, tiebreaker_values)."""
-        ranks = sorted([self._rank_value(c[0]) for c in hand], reverse=True)
-        suits = [c[1] for c in hand]
-        rank_counts = Counter(ranks)
-        most_common = rank_counts.most_common()
-
-        is_flush = len(set(suits)) == 1
-        is_straight = (max(ranks) - min(ranks) == 4 and len(set(ranks)) == 5) or \
-                      ranks == [14, 5, 4, 3, 2]  # Wheel
+        return _CARD_RANKS[rank]
 
-        if is_straight and ranks == [14, 5, 4, 3, 2]:
-            ranks = [5, 4, 3, 2, 1]  # Ace-low straight
+    def _evaluate_hand(self, hand: list[tuple[str, str]]) -> _HandValue:
+        """Evaluate a poker hand. Returns (rank_index, tiebreaker_values).
 
-        if is_straight and is_flush:
-            if ranks == [14, 13, 12, 11, 10]:
-                return (9, ranks)  # Royal flush
-            return (8, ranks)  # Straight flush
-
-        if most_common[0][1] == 4:
-            return (7, ranks)  # Four of a kind
-
-        if most_common[0][1] == 3 and most_common[1][1] == 2:
-            return (6, ranks)  # Full house
-
-        if is_flush:
-            return (5, ranks)  # Flush
-
-        if is_straight:
-            return (4, ranks)  # Straight
-
-        if most_common[0][1] == 3:
-            return (3, ranks)  # Three of a kind
-
-        if most_common[0][1] == 2 and most_common[1][1] == 2:
-            return (2, ranks)  # Two pair
-
-        if most_common[0][1] == 2:
-            return (1, ranks)  # One pair
-
-        return (0, ranks)  # High card
+        Tiebreakers list ranks by group size, then rank, so equal categories
+        compare the way poker ranks them.
+        """
+        a, b, c, d, e = (_CARD_INT[card] for card in hand)
+        if a & b & c & d & e & 0xF000:
+            return _FLUSH_LOOKUP[(a | b | c | d | e) >> 16]
+        return _UNSUITED_LOOKUP[(a & 0xFF) * (b & 0xFF) * (c & 0xFF) * (d & 0xFF) * (e & 0xFF)]
 
     def _render_card(self, card: tuple[str, str]) -> list[str]:
         """Render a single card as ASCII art lines."""
@@ -154,31 +188,28 @@ Commands:
     def _deal_hands(self) -> None:
         """Deal fresh hands to both players."""
         self._shuffle_deck()
-        self._player_hand = [self._draw_card() for _ in range(5)]
-        self._wopr_hand = [self._draw_card() for _ in range(5)]
+        # Deal from the top of the deck, the end _draw_card pops from
+        deck = self._deck
+        self._player_hand = deck[:-6:-1]
+        self._wopr_hand = deck[-6:-11:-1]
+        del deck[-10:]
 
     def _wopr_discard(self) -> None:
         """WOPR decides which cards to discard."""
-        rank_idx, _ = self._evaluate_hand(self._wopr_hand)
+        rank_idx, ranks = self._evaluate_hand(self._wopr_hand)
 
         # Simple AI: keep pairs and high cards
         if rank_idx >= 3:  # Three of a kind or better
             return  # Keep all
 
-        ranks = [self._rank_value(c[0]) for c in self._wopr_hand]
-        rank_counts = Counter(ranks)
-
-        # Keep pairs
-        keep_ranks = {r for r, count in rank_counts.items() if count >= 2}
-        if not keep_ranks:
-            # Keep highest two cards
-            sorted_ranks = sorted(set(ranks), reverse=True)[:2]
-            keep_ranks = set(sorted_ranks)
+        # Tiebreakers list paired ranks first, so one or two pairs are the
+        # first 2 or 4 entries; with no pair, keep the highest two cards
+        keep_ranks = set(ranks[:2 * rank_idx]) or set(ranks[:2])
 
         # Discard and draw
         new_hand = []
         for card in self._wopr_hand:
-            if self._rank_value(card[0]) in keep_ranks:
+            if _CARD_RANKS[card[0]] in keep_ranks:
                 new_hand.append(card)
             else:
                 new_card = self._draw_card()
@@ -204,28 +235,30 @@ Commands:
 
             # Player discard phase
             await self.output("\nDISCARD positions (e.g., 1,3,5) or KEEP all: ")
-            cmd = (await self._input()).strip().upper()
+            match = _CMD_RE.match(await self._input())
+            command = match.lastgroup if match else None
 
-            if cmd in {"FOLD", "F"}:
+            if command == "fold":
                 await self.output("YOU FOLD. WOPR WINS POT.\n")
                 continue
 
-            if cmd in {"QUIT", "Q"}:
+            if command == "quit":
                 break
 
-            if cmd not in {"KEEP", "K", ""}:
-                try:
-                    positions = [int(p.strip()) - 1 for p in cmd.replace("DISCARD", "").split(",")]
-                    positions = [p for p in positions if 0 <= p < 5]
+            if command == "discard":
+                # The regex already vouched for the digits; drop repeats and
+                # out-of-range positions before drawing anything
+                positions = {int(p) - 1 for p in match["discard"].replace(",", " ").split()}
+                positions &= {0, 1, 2, 3, 4}
 
-                    for pos in sorted(positions, reverse=True):
-                        new_card = self._draw_card()
-                        if new_card:
-                            self._player_hand[pos] = new_card
+                for pos in sorted(positions, reverse=True):
+                    new_card = self._draw_card()
+                    if new_card:
+                        self._player_hand[pos] = new_card
 
-                    await self.output(f"DREW {len(positions)} NEW CARDS\n")
-                except:
-                    await self.output("KEEPING ALL CARDS\n")
+                await self.output(f"DREW {len(positions)} NEW CARDS\n")
+            elif not match:
+                await self.output("KEEPING ALL CARDS\n")
 
             await self.output("\nYOUR HAND:\n")
             await self.output(self._render_hand(self._player_hand) + "\n")
@@ -27,6 +27,9 @@ Commands:
 Walls are represented by █
 """
 
+    # Maze characters for the carving grid's open/wall/border bytes
+    _CELL_CHARS = {0: " ", 1: "█", 2: "█"}
+
     def __init__(
         self,
         output_callback,
@@ -38,77 +41,100 @@ Walls are represented by █
         super().__init__(output_callback, input_callback, **kwargs)
         self._width = width if width % 2 == 1 else width + 1
         self._height = height if height % 2 == 1 else height + 1
+        # Double-width borders depend only on the width
+        self._top_border = "╔" + "══" * self._width + "╗"
+        self._bottom_border = "╚" + "══" * self._width + "╝"
         self._maze = []
+        self._frame = ""  # rendered maze, borders included, without the player
         self._player_pos = (1, 1)
         self._exit_pos = (0, 0)
         self._moves = 0
 
     def _generate_maze(self) -> None:
-        """Generate a maze using recursive backtracking."""
-        # Initialize with all walls
-        self._maze = [["█" for _ in range(self._width)] for _ in range(self._height)]
-
-        # Carve passages using recursive backtracking
-        def carve(x: int, y: int) -> None:
-            self._maze[y][x] = " "
-            directions = [(0, -2), (0, 2), (-2, 0), (2, 0)]
-            random.shuffle(directions)
-
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if 0 < nx < self._width - 1 and 0 < ny < self._height - 1:
-                    if self._maze[ny][nx] == "█":
-                        # Carve through the wall between
-                        self._maze[y + dy // 2][x + dx // 2] = " "
-                        carve(nx, ny)
+        """Generate a maze using depth-first backtracking."""
+        width, height = self._width, self._height
+        shuffle, randrange = random.shuffle, random.randrange
+        # Carve in a flat byte grid, one byte per cell: 1 = wall, 0 = open and
+        # 2 = outer border. Steps off the left or right edge land on the
+        # border of the neighbouring row, and steps off the top or bottom
+        # land in a spare border row at the end, so no bounds checks are needed
+        cells = bytearray(b"\x02") * (width * (height + 1))
+        for row_start in range(width, width * (height - 1), width):
+            cells[row_start + 1:row_start + width - 1] = b"\x01" * (width - 2)
+        # North, south, west, east, two cells at a time so walls stay between passages
+        carve_steps = (-2 * width, 2 * width, -2, 2)
+
+        # Carve passages with an explicit stack instead of recursion; each
+        # entry keeps its own shuffled directions, just as a call frame would
+        stack = []
+        push = stack.append
+
+        def visit(i: int) -> None:
+            cells[i] = 0
+            directions = list(carve_steps)
+            shuffle(directions)
+            push((i, iter(directions)))
 
         # Start from a random odd position
-        start_x = random.randrange(1, self._width - 1, 2)
-        start_y = random.randrange(1, self._height - 1, 2)
-        carve(start_x, start_y)
+        start_x = randrange(1, width - 1, 2)
+        start_y = randrange(1, height - 1, 2)
+        visit(start_y * width + start_x)
+
+        while stack:
+            i, directions = stack[-1]
+            for step in directions:
+                if cells[i + step] == 1:
+                    # Carve through the wall between
+                    cells[i + step // 2] = 0
+                    visit(i + step)
+                    break
+            else:
+                # Dead end - backtrack
+                stack.pop()
 
         # Set player start position (top-left area)
         self._player_pos = (1, 1)
-        self._maze[1][1] = " "
+        cells[width + 1] = 0
 
         # Set exit position (bottom-right area)
-        self._exit_pos = (self._width - 2, self._height - 2)
-        self._maze[self._height - 2][self._width - 2] = " "
+        self._exit_pos = (width - 2, height - 2)
+        exit_i = (height - 2) * width + width - 2
+        cells[exit_i] = 0
 
         # Ensure there's a path - connect if needed
         # Make sure start and end are accessible
-        if self._maze[1][2] == "█" and self._maze[2][1] == "█":
-            self._maze[1][2] = " "
-        if self._maze[self._height - 2][self._width - 3] == "█" and self._maze[self._height - 3][self._width - 2] == "█":
-            self._maze[self._height - 2][self._width - 3] = " "
+        if cells[width + 2] and cells[2 * width + 1]:
+            cells[width + 2] = 0
+        if cells[exit_i - 1] and cells[exit_i - width]:
+            cells[exit_i - 1] = 0
+
+        rows = cells[:width * height].decode("latin-1").translate(self._CELL_CHARS)
+        self._maze = [list(rows[i:i + width]) for i in range(0, len(rows), width)]
+
+        self._frame = self._render_frame()
+
+    def _render_frame(self) -> str:
+        """Render the static maze, with start and exit marked, at double width."""
+        rows = [["██" if cell == "█" else "  " for cell in row] for row in self._maze]
+        rows[1][1] = "SS"
+        exit_x, exit_y = self._exit_pos
+        rows[exit_y][exit_x] = "EE"
+        lines = [self._top_border]
+        lines.extend(f"║{''.join(row)}║" for row in rows)
+        lines.append(self._bottom_border)
+        return "\n".join(lines)
 
     def _render_maze(self) -> str:
         """Render the maze with player and exit using double-width cells."""
-        lines = []
-        # Double-width border
-        lines.append("╔" + "══" * self._width + "╗")
-
-        for y in range(self._height):
-            row = "║"
-            for x in range(self._width):
-                if (x, y) == self._player_pos:
-                    row += "@@"
-                elif (x, y) == self._exit_pos:
-                    row += "EE"
-                elif x == 1 and y == 1:
-                    row += "SS"
-                elif self._maze[y][x] == "█":
-                    row += "██"
-                else:
-                    row += "  "
-            row += "║"
-            lines.append(row)
-
-        lines.append("╚" + "══" * self._width + "╝")
-        lines.append("")
-        lines.append(f"  MOVES: {self._moves}")
-        lines.append("  S = START    E = EXIT    @ = YOU")
-        return "\n".join(lines)
+        # Splice the player into the prerendered frame; each line holds
+        # two border characters, two per cell and a newline
+        x, y = self._player_pos
+        pos = (y + 1) * (2 * self._width + 3) + 1 + 2 * x
+        return (
+            f"{self._frame[:pos]}@@{self._frame[pos + 2:]}\n"
+            f"\n  MOVES: {self._moves}\n"
+            "  S = START    E = EXIT    @ = YOU"
+        )
 
     def _can_move(self, x: int, y: int) -> bool:
         """Check if a position is valid to move to."""
@@ -126,14 +152,15 @@ Walls are represented by █
         self._running = True
 
         while self._running:
-            await self.output("\n" + self._render_maze() + "\n")
+            frame = f"\n{self._render_maze()}\n"
 
             # Check win condition
             if self._player_pos == self._exit_pos:
-                await self.output(f"\n*** MAZE COMPLETED IN {self._moves} MOVES ***\n")
+                await self.output(f"{frame}\n*** MAZE COMPLETED IN {self._moves} MOVES ***\n")
                 return {"result": GameResult.WIN, "moves": self._moves}
 
-            await self.output("\nMOVE (N/S/E/W or Q): ")
+            # One write per turn: the frame and the prompt together
+            await self.output(f"{frame}\nMOVE (N/S/E/W or Q): ")
             cmd = (await self._input()).strip().upper()
 
             if cmd in {"Q", "QUIT"}:
@@ -172,27 +199,40 @@ class MazeSolver:
     @staticmethod
     def solve(maze: list[list[str]], start: tuple[int, int], end: tuple[int, int]) -> list[tuple[int, int]] | None:
         """Solve a maze using BFS. Returns path or None if unsolvable."""
-        from collections import deque
-
         height = len(maze)
         width = len(maze[0])
-        visited = set()
-        queue = deque([(start, [start])])
-
-        while queue:
-            (x, y), path = queue.popleft()
-
-            if (x, y) == end:
-                return path
-
-            if (x, y) in visited:
-                continue
-            visited.add((x, y))
-
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < width and 0 <= ny < height:
-                    if maze[ny][nx] != "█" and (nx, ny) not in visited:
-                        queue.append(((nx, ny), path + [(nx, ny)]))
-
-        return None
+        size = width * height
+        # Walk flat cell indices (y * width + x) instead of coordinate tuples
+        cells = "".join("".join(row) for row in maze)
+        start_i = start[1] * width + start[0]
+        end_i = end[1] * width + end[0]
+        # Each reached cell holds the index it was reached from; -1 = unreached
+        parents = [-1] * size
+        parents[start_i] = start_i
+        queue = [start_i]
+
+        # The queue only grows at the end, so iterating it is a FIFO walk
+        for i in queue:
+            if i == end_i:
+                break
+            x = i % width
+            for j, inside in (
+                (i + width, i + width < size),
+                (i - width, i >= width),
+                (i + 1, x + 1 < width),
+                (i - 1, x > 0),
+            ):
+                if inside and parents[j] < 0 and cells[j] != "█":
+                    parents[j] = i
+                    queue.append(j)
+
+        if parents[end_i] < 0:
+            return None
+
+        path = [end]
+        i = end_i
+        while i != start_i:
+            i = parents[i]
+            path.append((i % width, i // width))
+        path.reverse()
+        return path
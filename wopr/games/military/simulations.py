@@ -1,11 +1,21 @@
 """Military simulation games for WOPR."""
 
 from typing import Any
+from collections import deque
 import random
 import asyncio
 
 from ..base import BaseGame, GameResult
 
+# Campaign gauges by fill level: reserves in tenths, front control in twentieths
+_RESERVE_BARS = tuple("█" * n + "░" * (10 - n) for n in range(11))
+_FRONT_BARS = tuple("█" * n + "░" * (20 - n) for n in range(21))
+
+
+def _clip100(value: int) -> int:
+    """Clamp a percentage to the 0-100 range."""
+    return 0 if value < 0 else 100 if value > 100 else value
+
 
 class MilitarySimulation(BaseGame):
     """Generic military simulation framework."""
@@ -43,210 +53,293 @@ class MilitarySimulation(BaseGame):
         },
     }
 
+    # Simulation method for each game's mechanics
+    _HANDLERS = {
+        "energy": "_play_fighter_combat",
+        "hearts_minds": "_play_guerrilla",
+        "maneuver": "_play_desert_warfare",
+        "strike": "_play_air_to_ground",
+        "campaign": "_play_tactical_warfare",
+        "ethical": "_play_biotoxic_warfare",
+    }
+
+    # Intro line for simulations whose orders are numbered menu choices
+    _TYPE_AHEAD_HINT = '    Orders may be typed ahead on one line, e.g. "2 4 3".\n\n'
+
+    # Campaign fronts, and the command that reinforces each
+    _FRONT_NAMES = ("NORTH", "CENTER", "SOUTH")
+    _FRONT_COMMANDS = {"N": 0, "C": 1, "S": 2}
+
+    # Biotoxic scenarios: situation, then (name, description, military, ethical) options
+    _BIOTOXIC_SCENARIOS = (
+        (
+            "Intelligence indicates the enemy is preparing a chemical attack.",
+            (
+                ("PREEMPTIVE STRIKE", "Strike first with conventional weapons", 20, -10),
+                ("DEFENSIVE POSTURE", "Prepare defenses and protective gear", 0, 0),
+                ("DIPLOMATIC CHANNEL", "Warn of consequences through back channels", 10, 5),
+            ),
+        ),
+        (
+            "Enemy forces have used chemical weapons on your troops.",
+            (
+                ("RETALIATE IN KIND", "Chemical counterattack", -50, -30),
+                ("CONVENTIONAL RESPONSE", "Massive conventional strike", 10, -10),
+                ("SEEK CEASEFIRE", "Attempt immediate negotiations", 20, 20),
+            ),
+        ),
+        (
+            "A biological agent has been released in a contested city.",
+            (
+                ("QUARANTINE", "Seal the city, prioritize containment", 5, 0),
+                ("EVACUATION", "Evacuate civilians despite spread risk", -10, 15),
+                ("MILITARY INTERVENTION", "Send troops to secure the area", 0, -5),
+            ),
+        ),
+    )
+
+    # Each scenario's situation, numbered options and prompt, formatted once
+    _BIOTOXIC_PROMPTS = tuple(
+        f"{situation}\n\n"
+        + "".join(f"  {j + 1}. {name}\n     {desc}\n" for j, (name, desc, _, _) in enumerate(options))
+        + "\nYOUR DECISION (or Q to quit): "
+        for situation, options in _BIOTOXIC_SCENARIOS
+    )
+
+    # Action menus, formatted once rather than every turn
+    _FIGHTER_MENU = (
+        "      1. CLIMB    - Gain altitude and energy\n"
+        "      2. DIVE     - Trade altitude for speed\n"
+        "      3. TURN     - Turn to engage\n"
+        "      4. FIRE     - Fire missile\n"
+        "      5. EVADE    - Defensive maneuver\n"
+    )
+    # Fighter maneuvers: (altitude, energy, distance) changes and report
+    _FIGHTER_EFFECTS = {
+        "1": (5000, -20, 0, "CLIMBING...\n"),
+        "2": (-5000, 30, -1, "DIVING TO ENGAGE...\n"),
+        "3": (0, -15, -2, "TURNING TO ENGAGE...\n"),
+        "5": (0, -25, 3, "BREAKING!\n"),
+    }
+    _GUERRILLA_MENU = (
+        "      1. PATROL   - Secure area, moderate support gain\n"
+        "      2. AID      - Provide humanitarian aid, high support gain\n"
+        "      3. STRIKE   - Military strike, reduces insurgents but may lose support\n"
+        "      4. INTEL    - Gather intelligence\n"
+    )
+    _DESERT_MENU = (
+        "      1. ADVANCE    - Push toward objective\n"
+        "      2. FLANK      - Risky maneuver, high reward\n"
+        "      3. DEFEND     - Hold position\n"
+        "      4. ARTILLERY  - Call fire support\n"
+    )
+    _AIR_STRIKE_MENU = (
+        "      1. A-10 LOW PASS   - High accuracy, vulnerable to AAA\n"
+        "      2. F-111 STANDOFF  - Medium accuracy, safer\n"
+        "      3. AC-130 ORBIT    - Sustained fire, slow\n"
+    )
+    # Aircraft: (success chance, loss chance, sorties used)
+    _AIR_STRIKE_AIRCRAFT = {
+        "1": (85, 20, 1),
+        "2": (60, 5, 1),
+        "3": (75, 10, 2),
+    }
+    _AIR_STRIKE_TARGETS = ("ARMOR COLUMN", "SAM SITE", "SUPPLY DEPOT", "COMMAND POST", "BRIDGE")
+
     def __init__(
         self,
         game_name: str,
         output_callback,
         input_callback,
+        pacing: float = 1.0,
         **kwargs
     ) -> None:
         super().__init__(output_callback, input_callback, **kwargs)
         self._game_name = game_name.upper()
+        self._pacing = pacing  # dramatic pause in seconds; 0 skips it
         self._game_config = self.GAMES.get(self._game_name, self.GAMES["FIGHTER COMBAT"])
+        # Title banner every simulation opens with
+        self._banner = f"\n{'═' * 60}\n    {self._game_name}\n{'═' * 60}\n\n"
         self._turn = 0
         self._player_score = 0
         self._enemy_score = 0
         self._resources = 100
+        self._pending: deque[str] = deque()  # commands typed ahead on one line
+
+    async def _next_command(self) -> str:
+        """Return the next command, reading a new line only when none are queued.
+
+        A line may hold several commands separated by spaces or commas
+        (e.g. "2 4 3"); they are played one per turn before asking again.
+        """
+        if not self._pending:
+            self._pending.extend((await self._input()).replace(",", " ").split() or [""])
+        return self._pending.popleft()
 
     async def play(self) -> dict[str, Any]:
         """Play the military simulation."""
-        mechanics = self._game_config["mechanics"]
-
-        if mechanics == "energy":
-            return await self._play_fighter_combat()
-        elif mechanics == "hearts_minds":
-            return await self._play_guerrilla()
-        elif mechanics == "maneuver":
-            return await self._play_desert_warfare()
-        elif mechanics == "strike":
-            return await self._play_air_to_ground()
-        elif mechanics == "campaign":
-            return await self._play_tactical_warfare()
-        elif mechanics == "ethical":
-            return await self._play_biotoxic_warfare()
-        else:
-            return await self._play_generic()
+        handler = self._HANDLERS.get(self._game_config["mechanics"], "_play_generic")
+        return await getattr(self, handler)()
 
     async def _play_fighter_combat(self) -> dict[str, Any]:
         """Fighter combat simulation - energy management dogfighting."""
-        await self.output(f"\n{'═' * 60}\n")
-        await self.output(f"    {self._game_name}\n")
-        await self.output(f"{'═' * 60}\n\n")
-        await self.output("    You are piloting an F-15 Eagle.\n")
-        await self.output("    Enemy MIG-29 detected!\n\n")
+        await self.output(
+            f"{self._banner}"
+            "    You are piloting an F-15 Eagle.\n"
+            "    Enemy MIG-29 detected!\n\n"
+            f"{self._TYPE_AHEAD_HINT}"
+        )
+
+        randrange = random.randrange
 
         energy = 100  # Player's energy state
         enemy_energy = 100
         altitude = 20000  # feet
         distance = 10  # nautical miles
 
-        actions = {
-            "1": ("CLIMB", "Gain altitude and energy"),
-            "2": ("DIVE", "Trade altitude for speed"),
-            "3": ("TURN", "Turn to engage"),
-            "4": ("FIRE", "Fire missile"),
-            "5": ("EVADE", "Defensive maneuver"),
-        }
-
         while True:
-            await self.output(f"\n{'─' * 60}\n")
-            await self.output(f"    TURN {self._turn + 1}\n")
-            await self.output(f"{'─' * 60}\n\n")
-
             # Energy bars
             energy_bar = "█" * (energy // 10) + "░" * (10 - energy // 10)
             enemy_bar = "█" * (enemy_energy // 10) + "░" * (10 - enemy_energy // 10)
 
-            await self.output(f"    YOUR ENERGY:  [{energy_bar}] {energy:3}%\n")
-            await self.output(f"    ALTITUDE:     {altitude:,} ft\n\n")
-            await self.output(f"    ENEMY ENERGY: [{enemy_bar}] {enemy_energy:3}%\n")
-            await self.output(f"    DISTANCE:     {distance} nm\n\n")
-
-            for key, (name, desc) in actions.items():
-                await self.output(f"      {key}. {name:8} - {desc}\n")
-
-            await self.output("\nACTION (or Q to quit): ")
-            cmd = (await self._input()).strip().upper()
+            # The status display, menu and prompt go out in one write per turn
+            await self.output(
+                f"\n{'─' * 60}\n"
+                f"    TURN {self._turn + 1}\n"
+                f"{'─' * 60}\n\n"
+                f"    YOUR ENERGY:  [{energy_bar}] {energy:3}%\n"
+                f"    ALTITUDE:     {altitude:,} ft\n\n"
+                f"    ENEMY ENERGY: [{enemy_bar}] {enemy_energy:3}%\n"
+                f"    DISTANCE:     {distance} nm\n\n"
+                f"{self._FIGHTER_MENU}"
+                "\nACTION (or Q to quit): "
+            )
+            cmd = (await self._next_command()).upper()
 
             if cmd in {"Q", "QUIT"}:
                 return {"result": GameResult.QUIT}
 
-            if cmd == "1":  # Climb
-                altitude += 5000
-                energy -= 20
-                await self.output("CLIMBING...\n")
-            elif cmd == "2":  # Dive
-                altitude = max(1000, altitude - 5000)
-                energy = min(100, energy + 30)
-                distance -= 1
-                await self.output("DIVING TO ENGAGE...\n")
-            elif cmd == "3":  # Turn
-                energy -= 15
-                distance -= 2
-                await self.output("TURNING TO ENGAGE...\n")
+            # The turn's results are buffered and written once
+            msg = []
+            effect = self._FIGHTER_EFFECTS.get(cmd)
+            if effect:  # Climb, dive, turn or evade
+                d_altitude, d_energy, d_distance, report = effect
+                altitude = max(1000, altitude + d_altitude)
+                energy = min(100, energy + d_energy)
+                distance += d_distance
+                msg.append(report)
             elif cmd == "4":  # Fire
                 if distance <= 5 and energy >= 30:
                     hit_chance = 50 + (energy - enemy_energy) // 2
-                    if random.randint(1, 100) <= hit_chance:
-                        await self.output("*** MISSILE AWAY... HIT! ***\n")
-                        await self.output("SPLASH ONE BANDIT!\n")
+                    if randrange(100) < hit_chance:
+                        msg.append("*** MISSILE AWAY... HIT! ***\nSPLASH ONE BANDIT!\n")
+                        await self.output("".join(msg))
                         return {"result": GameResult.WIN}
                     else:
-                        await self.output("MISSILE MISSED!\n")
+                        msg.append("MISSILE MISSED!\n")
                         energy -= 20
                 else:
-                    await self.output("OUT OF RANGE OR LOW ENERGY\n")
-            elif cmd == "5":  # Evade
-                energy -= 25
-                distance += 3
-                await self.output("BREAKING!\n")
+                    msg.append("OUT OF RANGE OR LOW ENERGY\n")
 
             # Enemy AI turn
             if enemy_energy > 30 and distance <= 5:
-                if random.randint(1, 100) <= 30:
-                    await self.output("\nENEMY FIRES!\n")
-                    if random.randint(1, 100) <= 40 - (energy // 5):
-                        await self.output("*** YOU'VE BEEN HIT! ***\n")
-                        await self.output("EJECT! EJECT! EJECT!\n")
+                if randrange(100) < 30:
+                    msg.append("\nENEMY FIRES!\n")
+                    if randrange(100) < 40 - (energy // 5):
+                        msg.append("*** YOU'VE BEEN HIT! ***\nEJECT! EJECT! EJECT!\n")
+                        await self.output("".join(msg))
                         return {"result": GameResult.LOSE}
                     else:
-                        await self.output("MISSILE EVADED!\n")
+                        msg.append("MISSILE EVADED!\n")
             else:
                 enemy_energy = min(100, enemy_energy + 10)
                 distance -= 1
 
             self._turn += 1
             if self._turn > 20:
-                await self.output("\nBINGO FUEL - RETURNING TO BASE\n")
+                msg.append("\nBINGO FUEL - RETURNING TO BASE\n")
+                await self.output("".join(msg))
                 return {"result": GameResult.DRAW}
+            if msg:
+                await self.output("".join(msg))
 
     async def _play_guerrilla(self) -> dict[str, Any]:
         """Guerrilla engagement - hearts and minds."""
-        await self.output(f"\n{'═' * 60}\n")
-        await self.output(f"    {self._game_name}\n")
-        await self.output(f"{'═' * 60}\n\n")
-        await self.output("    You command counterinsurgency operations.\n")
-        await self.output("    Win the population's support while neutralizing threats.\n\n")
+        await self.output(
+            f"{self._banner}"
+            "    You command counterinsurgency operations.\n"
+            "    Win the population's support while neutralizing threats.\n\n"
+            f"{self._TYPE_AHEAD_HINT}"
+        )
+
+        randint = random.randint
 
         population_support = 50  # 0-100
         insurgent_strength = 50  # 0-100
         resources = 100
 
-        actions = {
-            "1": ("PATROL", "Secure area, moderate support gain"),
-            "2": ("AID", "Provide humanitarian aid, high support gain"),
-            "3": ("STRIKE", "Military strike, reduces insurgents but may lose support"),
-            "4": ("INTEL", "Gather intelligence"),
-        }
-
         while population_support > 0 and population_support < 100:
-            await self.output(f"\n{'─' * 60}\n")
-            await self.output(f"    MONTH {self._turn + 1}\n")
-            await self.output(f"{'─' * 60}\n\n")
-
             pop_bar = "█" * (population_support // 10) + "░" * (10 - population_support // 10)
             ins_bar = "█" * (insurgent_strength // 10) + "░" * (10 - insurgent_strength // 10)
 
-            await self.output(f"    POPULATION SUPPORT:  [{pop_bar}] {population_support:3}%\n")
-            await self.output(f"    INSURGENT STRENGTH:  [{ins_bar}] {insurgent_strength:3}%\n")
-            await self.output(f"    RESOURCES:           {resources}\n\n")
-
-            for key, (name, desc) in actions.items():
-                await self.output(f"      {key}. {name:8} - {desc}\n")
-
-            await self.output("\nACTION (or Q to quit): ")
-            cmd = (await self._input()).strip()
+            # The status display, menu and prompt go out in one write per turn
+            await self.output(
+                f"\n{'─' * 60}\n"
+                f"    MONTH {self._turn + 1}\n"
+                f"{'─' * 60}\n\n"
+                f"    POPULATION SUPPORT:  [{pop_bar}] {population_support:3}%\n"
+                f"    INSURGENT STRENGTH:  [{ins_bar}] {insurgent_strength:3}%\n"
+                f"    RESOURCES:           {resources}\n\n"
+                f"{self._GUERRILLA_MENU}"
+                "\nACTION (or Q to quit): "
+            )
+            cmd = await self._next_command()
 
             if cmd.upper() in {"Q", "QUIT"}:
                 return {"result": GameResult.QUIT}
 
+            # The turn's results are buffered and written once
+            msg = []
             if cmd == "1":  # Patrol
                 resources -= 10
-                population_support += random.randint(2, 8)
-                insurgent_strength -= random.randint(0, 5)
-                await self.output("PATROLS CONDUCTED\n")
+                population_support += randint(2, 8)
+                insurgent_strength -= randint(0, 5)
+                msg.append("PATROLS CONDUCTED\n")
             elif cmd == "2":  # Aid
                 resources -= 25
-                population_support += random.randint(5, 15)
-                await self.output("AID DISTRIBUTED\n")
+                population_support += randint(5, 15)
+                msg.append("AID DISTRIBUTED\n")
             elif cmd == "3":  # Strike
                 resources -= 20
-                insurgent_strength -= random.randint(10, 25)
-                civilian_casualties = random.randint(0, 10)
+                insurgent_strength -= randint(10, 25)
+                civilian_casualties = randint(0, 10)
                 population_support -= civilian_casualties
                 if civilian_casualties > 5:
-                    await self.output(f"STRIKE SUCCESSFUL BUT {civilian_casualties} CIVILIAN CASUALTIES\n")
+                    msg.append(f"STRIKE SUCCESSFUL BUT {civilian_casualties} CIVILIAN CASUALTIES\n")
                 else:
-                    await self.output("STRIKE SUCCESSFUL\n")
+                    msg.append("STRIKE SUCCESSFUL\n")
             elif cmd == "4":  # Intel
                 resources -= 5
-                await self.output(f"INTEL GATHERED: INSURGENT HQ LOCATED\n")
+                msg.append("INTEL GATHERED: INSURGENT HQ LOCATED\n")
                 insurgent_strength -= 5
 
             # Insurgent turn
             if insurgent_strength > 30:
-                attack = random.randint(1, insurgent_strength // 10)
+                attack = randint(1, insurgent_strength // 10)
                 population_support -= attack
                 if attack > 3:
-                    await self.output(f"INSURGENT ATTACK! SUPPORT DROPS {attack}%\n")
+                    msg.append(f"INSURGENT ATTACK! SUPPORT DROPS {attack}%\n")
 
-            population_support = max(0, min(100, population_support))
-            insurgent_strength = max(0, min(100, insurgent_strength))
+            population_support = _clip100(population_support)
+            insurgent_strength = _clip100(insurgent_strength)
             self._turn += 1
 
             if insurgent_strength <= 10:
-                await self.output("\nINSURGENCY DEFEATED!\n")
+                msg.append("\nINSURGENCY DEFEATED!\n")
+                await self.output("".join(msg))
                 return {"result": GameResult.WIN}
+            if msg:
+                await self.output("".join(msg))
 
         if population_support >= 80:
             await self.output("\nPEACE ACHIEVED THROUGH POPULAR SUPPORT!\n")
@@ -257,11 +350,14 @@ class MilitarySimulation(BaseGame):
 
     async def _play_desert_warfare(self) -> dict[str, Any]:
         """Desert warfare - armored maneuver."""
-        await self.output(f"\n{'═' * 60}\n")
-        await self.output(f"    {self._game_name}\n")
-        await self.output(f"{'═' * 60}\n\n")
-        await self.output("    Command your armored battalion across the desert.\n")
-        await self.output("    Capture objectives while preserving your forces.\n\n")
+        await self.output(
+            f"{self._banner}"
+            "    Command your armored battalion across the desert.\n"
+            "    Capture objectives while preserving your forces.\n\n"
+            f"{self._TYPE_AHEAD_HINT}"
+        )
+
+        randint, chance = random.randint, random.random
 
         tanks = 12
         enemy_tanks = 15
@@ -269,68 +365,69 @@ class MilitarySimulation(BaseGame):
         total_objectives = 3
 
         while tanks > 0 and objectives < total_objectives:
-            await self.output(f"\n{'─' * 60}\n")
-            await self.output(f"    PHASE {self._turn + 1}\n")
-            await self.output(f"{'─' * 60}\n\n")
-
             # Tank strength visualization
             tank_bar = "▓" * tanks + "░" * (15 - tanks)
             enemy_bar = "▓" * enemy_tanks + "░" * (15 - enemy_tanks)
             obj_bar = "★" * objectives + "☆" * (total_objectives - objectives)
 
-            await self.output(f"    YOUR TANKS:   [{tank_bar}] {tanks:2}\n")
-            await self.output(f"    ENEMY TANKS:  [{enemy_bar}] {enemy_tanks:2}\n")
-            await self.output(f"    OBJECTIVES:   [{obj_bar}] {objectives}/{total_objectives}\n\n")
-
-            await self.output("      1. ADVANCE    - Push toward objective\n")
-            await self.output("      2. FLANK      - Risky maneuver, high reward\n")
-            await self.output("      3. DEFEND     - Hold position\n")
-            await self.output("      4. ARTILLERY  - Call fire support\n")
-
-            await self.output("\nORDERS (or Q to quit): ")
-            cmd = (await self._input()).strip()
+            # The status display, menu and prompt go out in one write per turn
+            await self.output(
+                f"\n{'─' * 60}\n"
+                f"    PHASE {self._turn + 1}\n"
+                f"{'─' * 60}\n\n"
+                f"    YOUR TANKS:   [{tank_bar}] {tanks:2}\n"
+                f"    ENEMY TANKS:  [{enemy_bar}] {enemy_tanks:2}\n"
+                f"    OBJECTIVES:   [{obj_bar}] {objectives}/{total_objectives}\n\n"
+                f"{self._DESERT_MENU}"
+                "\nORDERS (or Q to quit): "
+            )
+            cmd = await self._next_command()
 
             if cmd.upper() in {"Q", "QUIT"}:
                 return {"result": GameResult.QUIT}
 
+            # The turn's results are buffered and written once
+            msg = []
             if cmd == "1":  # Advance
-                lost = random.randint(1, 3)
-                enemy_lost = random.randint(2, 4)
+                lost = randint(1, 3)
+                enemy_lost = randint(2, 4)
                 tanks -= lost
                 enemy_tanks -= enemy_lost
-                if random.random() < 0.4:
+                if chance() < 0.4:
                     objectives += 1
-                    await self.output(f"OBJECTIVE CAPTURED! Lost {lost} tanks, destroyed {enemy_lost} enemy.\n")
+                    msg.append(f"OBJECTIVE CAPTURED! Lost {lost} tanks, destroyed {enemy_lost} enemy.\n")
                 else:
-                    await self.output(f"ADVANCE STALLED. Lost {lost} tanks, destroyed {enemy_lost} enemy.\n")
+                    msg.append(f"ADVANCE STALLED. Lost {lost} tanks, destroyed {enemy_lost} enemy.\n")
 
             elif cmd == "2":  # Flank
-                if random.random() < 0.5:
-                    enemy_lost = random.randint(4, 7)
+                if chance() < 0.5:
+                    enemy_lost = randint(4, 7)
                     enemy_tanks -= enemy_lost
                     objectives += 1
-                    await self.output(f"FLANKING ATTACK SUCCESSFUL! Destroyed {enemy_lost} enemy tanks.\n")
+                    msg.append(f"FLANKING ATTACK SUCCESSFUL! Destroyed {enemy_lost} enemy tanks.\n")
                 else:
-                    lost = random.randint(3, 5)
+                    lost = randint(3, 5)
                     tanks -= lost
-                    await self.output(f"FLANKING ATTACK FAILED! Lost {lost} tanks.\n")
+                    msg.append(f"FLANKING ATTACK FAILED! Lost {lost} tanks.\n")
 
             elif cmd == "3":  # Defend
-                enemy_lost = random.randint(1, 3)
+                enemy_lost = randint(1, 3)
                 enemy_tanks -= enemy_lost
-                await self.output(f"HOLDING POSITION. Destroyed {enemy_lost} enemy tanks.\n")
+                msg.append(f"HOLDING POSITION. Destroyed {enemy_lost} enemy tanks.\n")
 
             elif cmd == "4":  # Artillery
-                enemy_lost = random.randint(2, 5)
+                enemy_lost = randint(2, 5)
                 enemy_tanks -= enemy_lost
-                await self.output(f"ARTILLERY STRIKE! Destroyed {enemy_lost} enemy tanks.\n")
+                msg.append(f"ARTILLERY STRIKE! Destroyed {enemy_lost} enemy tanks.\n")
 
             enemy_tanks = max(0, enemy_tanks)
             self._turn += 1
 
             if enemy_tanks <= 0:
-                await self.output("\nENEMY FORCES DESTROYED!\n")
+                msg.append("\nENEMY FORCES DESTROYED!\n")
                 objectives = total_objectives
+            if msg:
+                await self.output("".join(msg))
 
         if objectives >= total_objectives:
             await self.output("\nVICTORY! ALL OBJECTIVES CAPTURED!\n")
@@ -341,72 +438,62 @@ class MilitarySimulation(BaseGame):
 
     async def _play_air_to_ground(self) -> dict[str, Any]:
         """Air-to-ground actions - strike missions."""
-        await self.output(f"\n{'═' * 60}\n")
-        await self.output(f"    {self._game_name}\n")
-        await self.output(f"{'═' * 60}\n\n")
-        await self.output("    Plan and execute close air support missions.\n\n")
+        await self.output(
+            f"{self._banner}"
+            "    Plan and execute close air support missions.\n\n"
+            f"{self._TYPE_AHEAD_HINT}"
+        )
+
+        randrange = random.randrange
 
         sorties = 8
         targets_destroyed = 0
-        targets_total = 5
+        targets_total = len(self._AIR_STRIKE_TARGETS)
         friendly_losses = 0
 
-        targets = ["ARMOR COLUMN", "SAM SITE", "SUPPLY DEPOT", "COMMAND POST", "BRIDGE"]
-
         while sorties > 0 and targets_destroyed < targets_total:
-            target = targets[targets_destroyed]
-            await self.output(f"\n{'─' * 60}\n")
-            await self.output(f"    MISSION {targets_destroyed + 1}\n")
-            await self.output(f"{'─' * 60}\n\n")
-
+            target = self._AIR_STRIKE_TARGETS[targets_destroyed]
             sortie_bar = "◆" * sorties + "◇" * (8 - sorties)
             target_bar = "✓" * targets_destroyed + "○" * (targets_total - targets_destroyed)
 
-            await self.output(f"    TARGET:            {target}\n\n")
-            await self.output(f"    SORTIES:           [{sortie_bar}] {sorties}\n")
-            await self.output(f"    TARGETS DESTROYED: [{target_bar}] {targets_destroyed}/{targets_total}\n\n")
-
-            await self.output("      1. A-10 LOW PASS   - High accuracy, vulnerable to AAA\n")
-            await self.output("      2. F-111 STANDOFF  - Medium accuracy, safer\n")
-            await self.output("      3. AC-130 ORBIT    - Sustained fire, slow\n")
-
-            await self.output("\nSELECT AIRCRAFT (or Q to quit): ")
-            cmd = (await self._input()).strip()
+            # The status display, menu and prompt go out in one write per turn
+            await self.output(
+                f"\n{'─' * 60}\n"
+                f"    MISSION {targets_destroyed + 1}\n"
+                f"{'─' * 60}\n\n"
+                f"    TARGET:            {target}\n\n"
+                f"    SORTIES:           [{sortie_bar}] {sorties}\n"
+                f"    TARGETS DESTROYED: [{target_bar}] {targets_destroyed}/{targets_total}\n\n"
+                f"{self._AIR_STRIKE_MENU}"
+                "\nSELECT AIRCRAFT (or Q to quit): "
+            )
+            cmd = await self._next_command()
 
             if cmd.upper() in {"Q", "QUIT"}:
                 return {"result": GameResult.QUIT}
 
-            success_chance = 0
-            loss_chance = 0
-
-            if cmd == "1":
-                success_chance = 85
-                loss_chance = 20
-                sorties -= 1
-            elif cmd == "2":
-                success_chance = 60
-                loss_chance = 5
-                sorties -= 1
-            elif cmd == "3":
-                success_chance = 75
-                loss_chance = 10
-                sorties -= 2
-
-            if random.randint(1, 100) <= success_chance:
+            # Anything else wastes the turn without using a sortie
+            success_chance, loss_chance, used = self._AIR_STRIKE_AIRCRAFT.get(cmd, (0, 0, 0))
+            sorties -= used
+
+            if randrange(100) < success_chance:
                 targets_destroyed += 1
-                await self.output(f"*** {target} DESTROYED! ***\n")
+                msg = f"*** {target} DESTROYED! ***\n"
             else:
-                await self.output("ATTACK INEFFECTIVE\n")
+                msg = "ATTACK INEFFECTIVE\n"
 
-            if random.randint(1, 100) <= loss_chance:
+            if randrange(100) < loss_chance:
                 friendly_losses += 1
-                await self.output("!!! AIRCRAFT LOST TO ENEMY FIRE !!!\n")
+                msg += "!!! AIRCRAFT LOST TO ENEMY FIRE !!!\n"
 
+            await self.output(msg)
             self._turn += 1
 
         if targets_destroyed >= targets_total:
-            await self.output(f"\nMISSION SUCCESS! All targets destroyed.\n")
-            await self.output(f"Aircraft lost: {friendly_losses}\n")
+            await self.output(
+                "\nMISSION SUCCESS! All targets destroyed.\n"
+                f"Aircraft lost: {friendly_losses}\n"
+            )
             return {"result": GameResult.WIN}
         else:
             await self.output("\nMISSION FAILED - Out of sorties\n")
@@ -414,52 +501,63 @@ class MilitarySimulation(BaseGame):
 
     async def _play_tactical_warfare(self) -> dict[str, Any]:
         """Theaterwide tactical warfare - campaign."""
-        await self.output(f"\n{'═' * 60}\n")
-        await self.output(f"    {self._game_name}\n")
-        await self.output(f"{'═' * 60}\n\n")
-        await self.output("    Command the theater campaign.\n")
-        await self.output("    Manage multiple fronts and strategic resources.\n\n")
+        await self.output(
+            f"{self._banner}"
+            "    Command the theater campaign.\n"
+            "    Manage multiple fronts and strategic resources.\n\n"
+            "    Orders may be typed ahead on one line, e.g. \"N 30\" or \"N 30 S 20\".\n\n"
+        )
+
+        randint = random.randint
 
-        fronts = {"NORTH": 50, "CENTER": 50, "SOUTH": 50}  # Control percentage
+        control = [50, 50, 50]  # Control percentage, parallel to _FRONT_NAMES
+        weakest = min(control)  # updated whenever the fronts change
         reserves = 100
         days = 0
 
-        while all(v > 0 for v in fronts.values()) and any(v < 100 for v in fronts.values()):
-            await self.output(f"\n{'─' * 60}\n")
-            await self.output(f"    DAY {days + 1}\n")
-            await self.output(f"{'─' * 60}\n\n")
-
-            reserve_bar = "█" * (reserves // 10) + "░" * (10 - reserves // 10)
-            await self.output(f"    RESERVES: [{reserve_bar}] {reserves:3}\n\n")
-
-            await self.output("    FRONT STATUS:\n")
-            for front, control in fronts.items():
-                bar = "█" * (control // 5) + "░" * (20 - control // 5)
-                await self.output(f"      {front:8} [{bar}] {control:3}%\n")
-
-            await self.output("\nALLOCATE RESERVES TO FRONT (N/C/S) or Q to quit: ")
-            cmd = (await self._input()).strip().upper()
+        # Fight on while every front holds and at least one is not yet won
+        while 0 < weakest < 100:
+            reserve_bar = _RESERVE_BARS[reserves // 10]
+
+            # The status display and prompt go out in one write per turn
+            msg = [
+                f"\n{'─' * 60}\n"
+                f"    DAY {days + 1}\n"
+                f"{'─' * 60}\n\n"
+                f"    RESERVES: [{reserve_bar}] {reserves:3}\n\n"
+                "    FRONT STATUS:\n"
+            ]
+            msg.extend(
+                f"      {front:8} [{_FRONT_BARS[held // 5]}] {held:3}%\n"
+                for front, held in zip(self._FRONT_NAMES, control)
+            )
+            msg.append("\nALLOCATE RESERVES TO FRONT (N/C/S) or Q to quit: ")
+            await self.output("".join(msg))
+            cmd = (await self._next_command()).upper()
 
             if cmd in {"Q", "QUIT"}:
                 return {"result": GameResult.QUIT}
 
-            front_map = {"N": "NORTH", "C": "CENTER", "S": "SOUTH"}
-            if cmd in front_map:
-                front = front_map[cmd]
-                await self.output(f"AMOUNT (0-{reserves}): ")
-                try:
-                    amount = int(await self._input())
-                    amount = max(0, min(reserves, amount))
+            if cmd in self._FRONT_COMMANDS:
+                front = self._FRONT_COMMANDS[cmd]
+                if self._pending and not self._pending[0].isdecimal():
+                    # The next word typed ahead is an order, not an amount
+                    amount_str = ""
+                else:
+                    await self.output(f"AMOUNT (0-{reserves}): ")
+                    # Anything but a whole number leaves the reserves where they are
+                    amount_str = await self._next_command()
+                if amount_str.isdecimal():
+                    amount = min(reserves, int(amount_str))
                     reserves -= amount
-                    fronts[front] = min(100, fronts[front] + amount // 5)
-                    await self.output(f"REINFORCED {front}\n")
-                except:
-                    pass
+                    control[front] = min(100, control[front] + amount // 5)
+                    await self.output(f"REINFORCED {self._FRONT_NAMES[front]}\n")
+                else:
+                    await self.output(f"NO REINFORCEMENTS SENT TO {self._FRONT_NAMES[front]}\n")
 
             # Enemy counterattacks
-            for front in fronts:
-                attack = random.randint(5, 15)
-                fronts[front] = max(0, fronts[front] - attack)
+            control = [max(0, held - randint(5, 15)) for held in control]
+            weakest = min(control)
 
             reserves = min(100, reserves + 20)
             days += 1
@@ -467,10 +565,10 @@ class MilitarySimulation(BaseGame):
             if days > 30:
                 break
 
-        if all(v >= 100 for v in fronts.values()):
+        if weakest >= 100:
             await self.output("\nTOTAL VICTORY!\n")
             return {"result": GameResult.WIN}
-        elif any(v <= 0 for v in fronts.values()):
+        elif weakest <= 0:
             await self.output("\nFRONT COLLAPSED - DEFEAT\n")
             return {"result": GameResult.LOSE}
         else:
@@ -479,91 +577,61 @@ class MilitarySimulation(BaseGame):
 
     async def _play_biotoxic_warfare(self) -> dict[str, Any]:
         """Biotoxic and chemical warfare - ethical scenarios."""
-        await self.output(f"\n{'═' * 60}\n")
-        await self.output(f"    {self._game_name}\n")
-        await self.output(f"{'═' * 60}\n\n")
-        await self.output("    This simulation explores the consequences of NBC warfare.\n")
-        await self.output("    Your decisions have lasting implications.\n\n")
-
-        await asyncio.sleep(1)
-
-        scenarios = [
-            {
-                "situation": "Intelligence indicates the enemy is preparing a chemical attack.",
-                "options": [
-                    ("PREEMPTIVE STRIKE", "Strike first with conventional weapons", 20, -10),
-                    ("DEFENSIVE POSTURE", "Prepare defenses and protective gear", 0, 0),
-                    ("DIPLOMATIC CHANNEL", "Warn of consequences through back channels", 10, 5),
-                ],
-            },
-            {
-                "situation": "Enemy forces have used chemical weapons on your troops.",
-                "options": [
-                    ("RETALIATE IN KIND", "Chemical counterattack", -50, -30),
-                    ("CONVENTIONAL RESPONSE", "Massive conventional strike", 10, -10),
-                    ("SEEK CEASEFIRE", "Attempt immediate negotiations", 20, 20),
-                ],
-            },
-            {
-                "situation": "A biological agent has been released in a contested city.",
-                "options": [
-                    ("QUARANTINE", "Seal the city, prioritize containment", 5, 0),
-                    ("EVACUATION", "Evacuate civilians despite spread risk", -10, 15),
-                    ("MILITARY INTERVENTION", "Send troops to secure the area", 0, -5),
-                ],
-            },
-        ]
+        await self.output(
+            f"{self._banner}"
+            "    This simulation explores the consequences of NBC warfare.\n"
+            "    Your decisions have lasting implications.\n\n"
+            f"{self._TYPE_AHEAD_HINT}"
+        )
+
+        if self._pacing:
+            await asyncio.sleep(self._pacing)
 
         military_score = 0
         ethical_score = 50
 
-        for i, scenario in enumerate(scenarios):
-            await self.output(f"\n=== SCENARIO {i + 1} ===\n")
-            await self.output(f"{scenario['situation']}\n\n")
-
-            for j, (name, desc, mil, eth) in enumerate(scenario["options"]):
-                await self.output(f"  {j + 1}. {name}\n     {desc}\n")
-
-            await self.output("\nYOUR DECISION (or Q to quit): ")
-            cmd = (await self._input()).strip()
+        for i, (_, options) in enumerate(self._BIOTOXIC_SCENARIOS):
+            await self.output(f"\n=== SCENARIO {i + 1} ===\n{self._BIOTOXIC_PROMPTS[i]}")
+            cmd = await self._next_command()
 
             if cmd.upper() in {"Q", "QUIT"}:
                 return {"result": GameResult.QUIT}
 
-            try:
-                choice = int(cmd) - 1
-                if 0 <= choice < len(scenario["options"]):
-                    name, desc, mil, eth = scenario["options"][choice]
-                    military_score += mil
-                    ethical_score += eth
-                    await self.output(f"\nYOU CHOSE: {name}\n")
-
-                    if eth < 0:
-                        await self.output("INTERNATIONAL CONDEMNATION FOLLOWS.\n")
-                    elif eth > 0:
-                        await self.output("YOUR RESTRAINT IS NOTED.\n")
-            except:
-                pass
-
-            ethical_score = max(0, min(100, ethical_score))
+            choice = int(cmd) - 1 if cmd.isdecimal() else -1
+            if 0 <= choice < len(options):
+                name, desc, mil, eth = options[choice]
+                military_score += mil
+                ethical_score += eth
+                if eth < 0:
+                    reaction = "INTERNATIONAL CONDEMNATION FOLLOWS.\n"
+                elif eth > 0:
+                    reaction = "YOUR RESTRAINT IS NOTED.\n"
+                else:
+                    reaction = ""
+                await self.output(f"\nYOU CHOSE: {name}\n{reaction}")
 
-        await self.output(f"\n=== FINAL ASSESSMENT ===\n")
-        await self.output(f"MILITARY OUTCOME: {'FAVORABLE' if military_score > 0 else 'UNFAVORABLE'}\n")
-        await self.output(f"ETHICAL STANDING: {ethical_score}%\n")
+            ethical_score = _clip100(ethical_score)
 
         if ethical_score >= 50 and military_score >= 0:
-            await self.output("\nBUT AT WHAT COST?\n")
-            await self.output("THE USE OF SUCH WEAPONS HAS NO WINNER.\n")
+            verdict = "\nBUT AT WHAT COST?\nTHE USE OF SUCH WEAPONS HAS NO WINNER.\n"
         else:
-            await self.output("\nTHE CONSEQUENCES WILL BE FELT FOR GENERATIONS.\n")
+            verdict = "\nTHE CONSEQUENCES WILL BE FELT FOR GENERATIONS.\n"
+        await self.output(
+            "\n=== FINAL ASSESSMENT ===\n"
+            f"MILITARY OUTCOME: {'FAVORABLE' if military_score > 0 else 'UNFAVORABLE'}\n"
+            f"ETHICAL STANDING: {ethical_score}%\n"
+            f"{verdict}"
+        )
 
         # This game always leads to reflection, like GTW
         return {"result": GameResult.NONE, "trigger_learning": False}
 
     async def _play_generic(self) -> dict[str, Any]:
         """Generic simulation fallback."""
-        await self.output(f"\n{self._game_name}\n")
-        await self.output(self._game_config.get("description", "Military simulation") + "\n\n")
-        await self.output("SIMULATION NOT FULLY IMPLEMENTED\n")
-        await self.output("RETURNING TO GAME LIST...\n")
+        await self.output(
+            f"\n{self._game_name}\n"
+            f"{self._game_config.get('description', 'Military simulation')}\n\n"
+            "SIMULATION NOT FULLY IMPLEMENTED\n"
+            "RETURNING TO GAME LIST...\n"
+        )
         return {"result": GameResult.QUIT}
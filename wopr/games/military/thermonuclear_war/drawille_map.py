@@ -1,10 +1,39 @@
 """ASCII world map with Drawille missile trajectory overlays."""
 
 from drawille import Canvas
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import product
 import math
 
 
+@lru_cache(maxsize=None)
+def _arc_steps(steps: int) -> tuple[tuple[float, float], ...]:
+    """(t, t - 1) for each of the ``steps + 1`` points along an arc."""
+    return tuple((i / steps, i / steps - 1) for i in range(steps + 1))
+
+
+# Textual markup escapes (\[ rather than Rich's [[)
+_MARKUP_ESCAPES = str.maketrans({'\\': '\\\\', '[': '\\[', ']': '\\]'})
+
+# (cos, sin) of each angle swept when filling an explosion
+_UNIT_CIRCLE = tuple(
+    (math.cos(rad), math.sin(rad))
+    for rad in map(math.radians, range(0, 360, 8))
+)
+
+
+@lru_cache(maxsize=None)
+def _disk_offsets(radius: int) -> tuple[tuple[float, float], ...]:
+    """Pixel offsets from the centre that fill a disk of ``radius``."""
+    return tuple(
+        (r * cos, r * sin)
+        for cos, sin in _UNIT_CIRCLE
+        for r in range(1, radius + 1)
+    )
+
+
 @dataclass
 class Missile:
     """A missile in flight with arc trajectory."""
@@ -13,6 +42,11 @@ class Missile:
     progress: float = 0.0   # 0.0 = launched, 1.0 = impact
     side: str = "US"        # Which side fired
     arc_height: float = 0.30  # Arc height as fraction of distance
+    # start, end and arc_height are fixed once launched, so the arc is only
+    # computed once per step count
+    _arc_cache: dict[int, tuple[tuple[int, int], ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @property
     def impacted(self) -> bool:
@@ -35,22 +69,24 @@ class Missile:
 
         return int(x), int(y)
 
-    def get_arc_points(self, steps: int = 60) -> list[tuple[int, int]]:
+    def get_arc_points(self, steps: int = 60) -> tuple[tuple[int, int], ...]:
         """Get all points along the FULL arc trajectory (shown like WarGames)."""
-        points = []
+        cached = self._arc_cache.get(steps)
+        if cached is not None:
+            return cached
         x1, y1 = self.start
         x2, y2 = self.end
-        distance = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+        dx, dy = x2 - x1, y2 - y1
+        distance = math.sqrt(dx**2 + dy**2)
         arc_h = distance * self.arc_height
+        # Parabolic arc offset is -4 * arc_h * t * (t - 1)
+        lift = -4 * arc_h
 
         # Draw the complete predicted arc path
-        for i in range(steps + 1):
-            t = i / steps
-            x = x1 + (x2 - x1) * t
-            arc_offset = -4 * arc_h * t * (t - 1)
-            y = y1 + (y2 - y1) * t - arc_offset
-            points.append((int(x), int(y)))
-
+        points = self._arc_cache[steps] = tuple(
+            (int(x1 + dx * t), int(y1 + dy * t - lift * t * t_minus_1))
+            for t, t_minus_1 in _arc_steps(steps)
+        )
         return points
 
 
@@ -91,6 +127,9 @@ class DrawilleWarMap:
     ASCII_HEIGHT = 24
     ARC_ROWS = 8  # Extra rows above map for arcs
 
+    # Pixel offsets of the 5x5 dot drawn at each missile's head
+    _HEAD_OFFSETS = tuple(product(range(-2, 3), repeat=2))
+
     # Key locations in PIXEL coordinates (for Drawille)
     # Y values offset by Y_OFFSET to leave room for arcs above
     # Positioned on the map: x = ascii_col * 2, y = (ascii_row * 4) + Y_OFFSET
@@ -148,6 +187,21 @@ class DrawilleWarMap:
         self.missiles: list[Missile] = []
         self.explosions: list[Explosion] = []
         self.impact_sites: list[tuple[int, int]] = []  # Pixel coordinates
+        # On-canvas arc pixels and their topmost row, keyed by arc geometry
+        # (start, end, arc_height); an arc only needs clipping once
+        self._canvas_arcs: dict[
+            tuple[tuple[int, int], tuple[int, int], float],
+            tuple[list[tuple[int, int]], int],
+        ] = {}
+        # Blank arc rows then the map, padded to one width and split into
+        # cells already escaped for Textual markup; frames reuse these
+        rows = [' ' * self.ASCII_WIDTH] * self.ARC_ROWS + list(self.ASCII_MAP)
+        self._row_width = max(map(len, rows))
+        self._escaped_rows = [
+            [char.translate(_MARKUP_ESCAPES) for char in row.ljust(self._row_width)]
+            for row in rows
+        ]
+        self._escaped_lines = [''.join(cells) for cells in self._escaped_rows]
 
     def add_missile(self, origin: str, target: str, side: str = "US") -> Missile:
         """Add a missile from origin to target location."""
@@ -155,6 +209,7 @@ class DrawilleWarMap:
         end = self.LOCATIONS.get(target.upper(), self.LOCATIONS["USSR_CENTER"])
         missile = Missile(start=start, end=end, side=side)
         self.missiles.append(missile)
+        self._clip_arc(missile)
         return missile
 
     def advance(self, step: float = 0.08) -> list[Missile]:
@@ -193,16 +248,27 @@ class DrawilleWarMap:
         self.missiles = []
         self.explosions = []
         self.impact_sites = []
+        self._canvas_arcs.clear()
+
+    def _clip_arc(self, missile: Missile) -> tuple[list[tuple[int, int]], int]:
+        """Get a missile's on-canvas arc pixels and their topmost row."""
+        key = (missile.start, missile.end, missile.arc_height)
+        arc = self._canvas_arcs.get(key)
+        if arc is None:
+            width, height = self.CANVAS_WIDTH, self.CANVAS_HEIGHT
+            lit = [(px, py) for px, py in missile.get_arc_points() if 0 <= px < width and 0 <= py < height]
+            top = min((py for _, py in lit), default=height)
+            arc = self._canvas_arcs[key] = lit, top
+        return arc
 
     def _draw_circle(self, canvas: Canvas, cx: int, cy: int, radius: int) -> None:
         """Draw a filled circle on the canvas."""
-        for angle in range(0, 360, 8):
-            rad = math.radians(angle)
-            for r in range(1, radius + 1):
-                x = int(cx + r * math.cos(rad))
-                y = int(cy + r * math.sin(rad))
-                if 0 <= x < self.CANVAS_WIDTH and 0 <= y < self.CANVAS_HEIGHT:
-                    canvas.set(x, y)
+        width, height = self.CANVAS_WIDTH, self.CANVAS_HEIGHT
+        for ox, oy in _disk_offsets(radius):
+            x = int(cx + ox)
+            y = int(cy + oy)
+            if 0 <= x < width and 0 <= y < height:
+                canvas.set(x, y)
 
     def _pixel_to_char(self, px: int, py: int) -> tuple[int, int]:
         """Convert pixel coordinates to ASCII character coordinates."""
@@ -214,23 +280,25 @@ class DrawilleWarMap:
         canvas = Canvas()
         min_y_pixel = self.CANVAS_HEIGHT  # Track minimum y for alignment
 
+        width, height = self.CANVAS_WIDTH, self.CANVAS_HEIGHT
+        set_pixel = canvas.set
+
         # Draw all missile arc trajectories (full predicted paths like WarGames)
         for missile in self.missiles:
-            for px, py in missile.get_arc_points():
-                if 0 <= px < self.CANVAS_WIDTH and 0 <= py < self.CANVAS_HEIGHT:
-                    canvas.set(px, py)
-                    min_y_pixel = min(min_y_pixel, py)
+            lit, top = self._clip_arc(missile)
+            for px, py in lit:
+                set_pixel(px, py)
+            min_y_pixel = min(min_y_pixel, top)
 
         # Draw missile heads (current position) - larger dot
         for missile in self.missiles:
             if not missile.impacted:
                 mx, my = missile.get_position()
-                for dx in range(-2, 3):
-                    for dy in range(-2, 3):
-                        px, py = mx + dx, my + dy
-                        if 0 <= px < self.CANVAS_WIDTH and 0 <= py < self.CANVAS_HEIGHT:
-                            canvas.set(px, py)
-                            min_y_pixel = min(min_y_pixel, py)
+                for dx, dy in self._HEAD_OFFSETS:
+                    px, py = mx + dx, my + dy
+                    if 0 <= px < width and 0 <= py < height:
+                        set_pixel(px, py)
+                        min_y_pixel = min(min_y_pixel, py)
 
         # Draw explosions as expanding circles
         for exp in self.explosions:
@@ -244,75 +312,58 @@ class DrawilleWarMap:
         drawille_lines = drawille_frame.split('\n')
         min_y_char = max(0, min_y_pixel // 4)  # Starting char row of drawille content
 
-        # Start with blank lines for arc space, then ASCII map
-        map_chars = []
-        # Add blank lines at top for missile arc space
-        for _ in range(self.ARC_ROWS):
-            map_chars.append([' '] * self.ASCII_WIDTH)
-        # Add the actual map
-        for line in self.ASCII_MAP:
-            map_chars.append(list(line))
-
-        # Ensure all lines are same length
-        max_len = max(len(line) for line in map_chars)
-        for line in map_chars:
-            while len(line) < max_len:
-                line.append(' ')
+        map_rows = self._escaped_rows
+        row_count = len(map_rows)
+        max_len = self._row_width
 
-        # Track positions with colored content (braille missiles and impacts)
-        colored_content: dict[tuple[int, int], str] = {}
+        # Track positions with colored content (braille missiles and impacts),
+        # grouped by character row so untouched rows can be reused as-is
+        colored_content: defaultdict[int, dict[int, str]] = defaultdict(dict)
 
         # Overlay Drawille braille characters onto ASCII map (RED for missiles)
         # drawille_lines[0] corresponds to character row min_y_char, not row 0
         for dy, dline in enumerate(drawille_lines):
-            actual_row = dy + min_y_char  # Offset to get actual map_chars row
-            if actual_row >= len(map_chars):
+            actual_row = dy + min_y_char  # Offset to get actual map row
+            if actual_row >= row_count:
                 break
             for dx, dchar in enumerate(dline):
                 if dx >= max_len:
                     break
                 # Only overlay if the braille character has dots (not blank)
                 if dchar != ' ' and ord(dchar) >= 0x2800:
-                    colored_content[(dx, actual_row)] = f'[red]{dchar}[/red]'
+                    colored_content[actual_row][dx] = f'[red]{dchar}[/red]'
 
         # Mark permanent impact sites with X (bold red)
         for px, py in self.impact_sites:
             cx, cy = self._pixel_to_char(px, py)
-            if 0 <= cx < max_len and 0 <= cy < len(map_chars):
+            if 0 <= cx < max_len and 0 <= cy < row_count:
                 # Don't overwrite active explosions
                 still_exploding = any(
                     self._pixel_to_char(e.x, e.y) == (cx, cy)
                     for e in self.explosions
                 )
                 if not still_exploding:
-                    colored_content[(cx, cy)] = '[bold red]X[/bold red]'
+                    colored_content[cy][cx] = '[bold red]X[/bold red]'
 
         # Build result with proper escaping for Textual markup
         # Textual uses \[ to escape brackets (not [[ like Rich)
         result_lines = []
         result_lines.append("                    [bold]GLOBAL THERMONUCLEAR WAR[/bold]")
         result_lines.append("")
-        # Arc space is built into map_chars (first ARC_ROWS lines are blank)
-
-        for y, line in enumerate(map_chars):
-            output_chars = []
-            for x, char in enumerate(line):
-                if (x, y) in colored_content:
-                    # Colored markup (red braille or red X)
-                    # Make sure previous char isn't a backslash that would escape it
-                    if output_chars and output_chars[-1].endswith('\\'):
-                        output_chars.append(' ')  # Add space to break escape
-                    output_chars.append(colored_content[(x, y)])
-                else:
-                    # Escape special chars for Textual markup (uses \[ not [[)
-                    if char == '[':
-                        output_chars.append('\\[')
-                    elif char == ']':
-                        output_chars.append('\\]')
-                    elif char == '\\':
-                        output_chars.append('\\\\')
-                    else:
-                        output_chars.append(char)
+        # Arc space is built into the map rows (first ARC_ROWS lines are blank)
+
+        for y, (line, cells) in enumerate(zip(self._escaped_lines, map_rows)):
+            overlay = colored_content.get(y)
+            if not overlay:
+                result_lines.append(line)
+                continue
+            output_chars = list(cells)
+            for x, markup in overlay.items():
+                # Colored markup (red braille or red X)
+                # Make sure previous char isn't a backslash that would escape it
+                if x and x - 1 not in overlay and cells[x - 1].endswith('\\'):
+                    markup = ' ' + markup  # Add space to break escape
+                output_chars[x] = markup
             result_lines.append(''.join(output_chars))
 
         return '\n'.join(result_lines)